@@ -90,6 +90,7 @@ from teamarr.consumers.team_processor import (
     TeamProcessingResult,
     TeamProcessor,
     get_all_team_xmltv,
+    iter_all_team_xmltv,
     process_all_teams,
     process_team,
 )
@@ -177,6 +178,7 @@ __all__ = [
     "TeamProcessor",
     "TeamProcessingResult",
     "get_all_team_xmltv",
+    "iter_all_team_xmltv",
     "process_all_teams",
     "process_team",
 ]
@@ -5,26 +5,127 @@ Refreshes team and league cache from all registered providers.
 
 import logging
 import os
+import sqlite3
+import threading
 import time
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from typing import TYPE_CHECKING
+
+import orjson
 
 from teamarr.core import SportsProvider
 from teamarr.database import get_db
 
 from .queries import TeamLeagueCache
 
+if TYPE_CHECKING:
+    from teamarr.providers.espn.client import ESPNClient
+
 logger = logging.getLogger(__name__)
 
-# Expected league counts per provider (for progress estimation)
-# These are approximate and used for work-proportional progress allocation
-EXPECTED_LEAGUES = {
-    "espn": 280,  # ~52 configured + ~228 discovered soccer leagues
-    "tsdb": 6,  # NRL, Boxing, IPL, BBL, BPL, SA20 (cricket primary, Cricbuzz fallback)
-    "hockeytech": 6,
-    "cricbuzz": 0,  # Cricket moved to TSDB primary (Cricbuzz is fallback for schedules only)
-}
+# Junk ESPN soccer leagues excluded from discovery
+SOCCER_SKIP_SLUGS = frozenset({"nonfifa", "usa.ncaa.m.1", "usa.ncaa.w.1"})
+SOCCER_SKIP_PATTERN = "not_used"
+
+# Shared ESPN client for league info fallback - one connection pool for all workers
+_espn_client: "ESPNClient | None" = None
+_espn_client_lock = threading.Lock()
+
+
+def _get_espn_client() -> "ESPNClient":
+    """Get or create the shared ESPN client singleton."""
+    global _espn_client
+    if _espn_client is None:
+        with _espn_client_lock:
+            if _espn_client is None:
+                from teamarr.providers.espn.client import ESPNClient
+
+                _espn_client = ESPNClient()
+    return _espn_client
+
+
+def _fetch_league_teams(
+    provider: SportsProvider,
+    league_slug: str,
+    sport: str,
+    db_metadata: sqlite3.Row | None,
+    espn_fallback: bool,
+) -> tuple[dict, list[dict]]:
+    """Fetch teams for a single league (runs in the refresh worker pool).
+
+    Args:
+        provider: Provider to fetch teams from
+        league_slug: League to fetch
+        sport: Sport inferred for the league
+        db_metadata: Row from the leagues table (single source of truth), or None
+        espn_fallback: Fill missing league name/logo from the ESPN API
+
+    Returns:
+        (league_info, team_entries) tuple
+    """
+    provider_name = provider.name
+    league_name = db_metadata["display_name"] if db_metadata else None
+    logo_url = db_metadata["logo_url"] if db_metadata else None
+
+    try:
+        league_teams = provider.get_league_teams(league_slug)
+
+        # Fall back to ESPN API only if the leagues table is incomplete
+        if (not logo_url or not league_name) and espn_fallback:
+            try:
+                league_info_api = _get_espn_client().get_league_info(league_slug)
+                if league_info_api:
+                    if not logo_url:
+                        logo_url = league_info_api.get("logo_url")
+                    if not league_name:
+                        league_name = league_info_api.get("name")
+            except Exception as e:
+                logger.debug(
+                    "[CACHE_REFRESH] Could not fetch league info for %s: %s", league_slug, e
+                )
+
+        league_info = {
+            "league_slug": league_slug,
+            "provider": provider_name,
+            "sport": sport,
+            "league_name": league_name,
+            "logo_url": logo_url,
+            "team_count": len(league_teams) if league_teams else 0,
+        }
+
+        team_entries = []
+        for team in league_teams or []:
+            team_entries.append(
+                {
+                    "team_name": team.name,
+                    "team_abbrev": team.abbreviation,
+                    "team_short_name": team.short_name,
+                    "provider": provider_name,
+                    "provider_team_id": team.id,
+                    "league": league_slug,
+                    "sport": team.sport or sport,
+                    "logo_url": team.logo_url,
+                }
+            )
+
+        return league_info, team_entries
+    except Exception as e:
+        logger.warning(
+            "[CACHE_REFRESH] Failed to fetch %s teams for %s: %s",
+            provider_name,
+            league_slug,
+            e,
+        )
+        return {
+            "league_slug": league_slug,
+            "provider": provider_name,
+            "sport": sport,
+            "league_name": league_name,
+            "logo_url": logo_url,
+            "team_count": 0,
+        }, []
 
 
 class CacheRefresher:
@@ -34,38 +135,34 @@ class CacheRefresher:
     # Configurable via ESPN_MAX_WORKERS for users with DNS throttling (PiHole, AdGuard)
     # Default is 50 (lower than team/event processors due to more API calls per league)
     MAX_WORKERS = int(os.environ.get("ESPN_MAX_WORKERS", 50))
-    # Update progress every N leagues
-    PROGRESS_UPDATE_INTERVAL = 5
 
     def __init__(self, db_factory: Callable = get_db) -> None:
         self._db = db_factory
+        # Per-refresh memo of leagues table lookups (sport inference + league info)
+        self._leagues_meta_cache: dict[str, sqlite3.Row | None] = {}
 
-    def _get_league_metadata(self, league_slug: str) -> dict | None:
+    def _get_league_metadata(self, league_slug: str) -> sqlite3.Row | None:
         """Get league metadata from the leagues table.
 
         The leagues table is the single source of truth for league display data.
+        Results are memoized for the duration of a refresh.
 
         Returns:
-            Dict with display_name, logo_url, sport, league_id or None
+            Row with display_name, logo_url, sport, league_id or None
         """
+        if league_slug in self._leagues_meta_cache:
+            return self._leagues_meta_cache[league_slug]
+
         with self._db() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            row = conn.execute(
                 """
                 SELECT display_name, logo_url, sport, league_id
                 FROM leagues WHERE league_code = ?
                 """,
                 (league_slug,),
-            )
-            row = cursor.fetchone()
-            if row:
-                return {
-                    "display_name": row["display_name"],
-                    "logo_url": row["logo_url"],
-                    "sport": row["sport"],
-                    "league_id": row["league_id"],
-                }
-        return None
+            ).fetchone()
+        self._leagues_meta_cache[league_slug] = row
+        return row
 
     def refresh(
         self,
@@ -81,13 +178,21 @@ class CacheRefresher:
         Returns:
             Dict with refresh statistics
         """
+        from teamarr.database.seed import load_tsdb_seed
         from teamarr.providers import ProviderRegistry
 
         start_time = time.time()
 
+        # Providers and fetches report concurrently; never let the bar move backwards
+        last_pct = 0
+
         def report(msg: str, pct: int) -> None:
+            nonlocal last_pct
+            last_pct = max(last_pct, pct)
             if progress_callback:
-                progress_callback(msg, pct)
+                progress_callback(msg, last_pct)
+
+        self._leagues_meta_cache.clear()
 
         try:
             self._set_refresh_in_progress(True)
@@ -112,45 +217,57 @@ class CacheRefresher:
                     "error": "No providers registered",
                 }
 
-            # Calculate work-proportional progress allocation
-            # Reserve 5% for start, 5% for saving = 90% for discovery
-            total_expected_leagues = sum(EXPECTED_LEAGUES.get(p.name, 10) for p in providers)
-
-            # Calculate progress ranges per provider based on expected work
-            provider_progress: list[tuple[SportsProvider, int, int]] = []
-            current_pct = 5  # Start at 5%
-            for provider in providers:
-                expected = EXPECTED_LEAGUES.get(provider.name, 10)
-                # Proportional share of the 90% discovery budget
-                share = int(90 * expected / total_expected_leagues)
-                end_pct = min(current_pct + share, 95)
-                provider_progress.append((provider, current_pct, end_pct))
-                current_pct = end_pct
-
-            for provider, start_pct, end_pct in provider_progress:
-                report(f"Fetching from {provider.name}...", start_pct)
-
-                # Create progress callback with captured values
-                def make_progress_callback(sp: int, ep: int) -> Callable[[str, int], None]:
-                    def callback(msg: str, pct: int) -> None:
-                        # Map 0-100% within this provider to start_pct-end_pct
-                        actual_pct = sp + int(pct * (ep - sp) / 100)
-                        report(msg, actual_pct)
-
-                    return callback
-
-                leagues, teams = self._discover_from_provider(
-                    provider, make_progress_callback(start_pct, end_pct)
-                )
-                all_leagues.extend(leagues)
-                all_teams.extend(teams)
+            # Load TSDB seed in the background so file parsing overlaps provider fetches
+            seed_executor = ThreadPoolExecutor(max_workers=1)
+            seed_future = seed_executor.submit(load_tsdb_seed)
+            seed_executor.shutdown(wait=False)
+
+            # Submit every provider's leagues to one pool and drain them together,
+            # so a slow provider doesn't delay the start of the next one
+            def discovery_progress(msg: str, pct: int) -> None:
+                # Map 0-10% soccer discovery progress into 5-15%
+                report(msg, 5 + pct)
+
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures: dict[Future, tuple[str, str]] = {}
+                for provider in providers:
+                    report(f"Discovering {provider.name} leagues...", 5)
+                    futures.update(
+                        self._discover_from_provider(provider, executor, discovery_progress)
+                    )
+
+                total = len(futures)
+                completed = 0
+                for future in as_completed(futures):
+                    completed += 1
+                    # Fetching maps to 15-95% (discovery uses 5-15%)
+                    report(f"Fetched {completed}/{total} leagues", 15 + int(80 * completed / total))
+
+                    provider_name, slug = futures[future]
+                    try:
+                        league_info, team_entries = future.result()
+                        all_leagues.append(league_info)
+                        all_teams.extend(team_entries)
+                    except Exception as e:
+                        logger.warning(
+                            "[CACHE_REFRESH] Error processing %s %s: %s", provider_name, slug, e
+                        )
+
+            logger.debug(
+                "[DISCOVERY] %d providers: %d leagues, %d teams",
+                num_providers,
+                len(all_leagues),
+                len(all_teams),
+            )
 
             # Merge TSDB seed data with API results before saving
             # This fills in teams that the free tier API doesn't return
-            all_teams, all_leagues = self._merge_with_seed(all_teams, all_leagues)
+            all_teams, all_leagues = self._merge_with_seed(
+                all_teams, all_leagues, seed_future.result()
+            )
 
             # Auto-discover Cricbuzz series IDs (yearly updates)
-            self._update_cricbuzz_series_ids(progress_callback)
+            self._update_cricbuzz_series_ids(report)
 
             # Save to database (95-100%)
             report(f"Saving {len(all_teams)} teams, {len(all_leagues)} leagues...", 95)
@@ -216,31 +333,30 @@ class CacheRefresher:
     def _discover_from_provider(
         self,
         provider: SportsProvider,
+        executor: ThreadPoolExecutor,
         progress_callback: Callable[[str, int], None] | None = None,
-    ) -> tuple[list[dict], list[dict]]:
-        """Discover all leagues and teams from a provider.
+    ) -> dict[Future, tuple[str, str]]:
+        """Discover all leagues from a provider and submit their team fetches.
 
         Uses the provider's get_supported_leagues() and get_league_teams() methods.
         For ESPN, also does dynamic soccer league discovery.
 
         Args:
             provider: The sports provider to discover from
+            executor: Shared pool the per-league fetches are submitted to
             progress_callback: Optional callback(message, percent)
 
         Returns:
-            (leagues, teams) tuple
+            Dict of future -> (provider_name, league_slug); each future resolves
+            to a (league_info, team_entries) tuple
         """
         provider_name = provider.name
-        leagues: list[dict] = []
-        teams: list[dict] = []
 
         # Get leagues this provider supports
         supported_leagues = provider.get_supported_leagues()
 
         # For ESPN, also discover dynamic soccer leagues
         if provider_name == "espn":
-            if progress_callback:
-                progress_callback("Discovering ESPN soccer leagues...", 0)
             soccer_slugs = self._fetch_espn_soccer_league_slugs(progress_callback)
             # Add soccer leagues not already in supported_leagues
             for slug in soccer_slugs:
@@ -249,118 +365,24 @@ class CacheRefresher:
 
         if not supported_leagues:
             logger.info("[CACHE_REFRESH] No leagues found for provider %s", provider_name)
-            return [], []
+            return {}
 
-        # Build league list with sport info
-        all_leagues_with_sport: list[tuple[str, str]] = []
+        futures = {}
         for league_slug in supported_leagues:
             # Determine sport from league slug
             sport = self._infer_sport_from_league(league_slug)
-            all_leagues_with_sport.append((league_slug, sport))
-
-        total = len(all_leagues_with_sport)
-        completed = 0
-
-        def fetch_league_teams(league_slug: str, sport: str) -> tuple[dict, list[dict]]:
-            """Fetch teams for a single league."""
-            try:
-                league_teams = provider.get_league_teams(league_slug)
-
-                # Check leagues table first (single source of truth)
-                db_metadata = self._get_league_metadata(league_slug)
-                league_name = db_metadata["display_name"] if db_metadata else None
-                logo_url = db_metadata["logo_url"] if db_metadata else None
-
-                # Fall back to ESPN API if not in leagues table
-                if (not logo_url or not league_name) and provider_name == "espn":
-                    try:
-                        from teamarr.providers.espn.client import ESPNClient
-
-                        client = ESPNClient()
-                        league_info_api = client.get_league_info(league_slug)
-                        if league_info_api:
-                            if not logo_url:
-                                logo_url = league_info_api.get("logo_url")
-                            if not league_name:
-                                league_name = league_info_api.get("name")
-                    except Exception as e:
-                        logger.debug(
-                            "[CACHE_REFRESH] Could not fetch league info for %s: %s", league_slug, e
-                        )
-
-                league_info = {
-                    "league_slug": league_slug,
-                    "provider": provider_name,
-                    "sport": sport,
-                    "league_name": league_name,
-                    "logo_url": logo_url,
-                    "team_count": len(league_teams) if league_teams else 0,
-                }
-
-                team_entries = []
-                for team in league_teams or []:
-                    team_entries.append(
-                        {
-                            "team_name": team.name,
-                            "team_abbrev": team.abbreviation,
-                            "team_short_name": team.short_name,
-                            "provider": provider_name,
-                            "provider_team_id": team.id,
-                            "league": league_slug,
-                            "sport": team.sport or sport,
-                            "logo_url": team.logo_url,
-                        }
-                    )
-
-                return league_info, team_entries
-            except Exception as e:
-                logger.warning(
-                    "[CACHE_REFRESH] Failed to fetch %s teams for %s: %s",
-                    provider_name,
-                    league_slug,
-                    e,
-                )
-                db_metadata = self._get_league_metadata(league_slug)
-                return {
-                    "league_slug": league_slug,
-                    "provider": provider_name,
-                    "sport": sport,
-                    "league_name": db_metadata["display_name"] if db_metadata else None,
-                    "logo_url": db_metadata["logo_url"] if db_metadata else None,
-                    "team_count": 0,
-                }, []
-
-        # Fetch in parallel
-        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-            futures = {
-                executor.submit(fetch_league_teams, slug, sport): (slug, sport)
-                for slug, sport in all_leagues_with_sport
-            }
-
-            for future in as_completed(futures):
-                completed += 1
-                # Report progress for every league (real-time streaming)
-                if progress_callback:
-                    pct = int((completed / total) * 100)
-                    progress_callback(f"{provider_name}: {completed}/{total} leagues", pct)
-
-                try:
-                    league_info, team_entries = future.result()
-                    leagues.append(league_info)
-                    teams.extend(team_entries)
-                except Exception as e:
-                    slug, sport = futures[future]
-                    logger.warning(
-                        "[CACHE_REFRESH] Error processing %s %s: %s", provider_name, slug, e
-                    )
+            future = executor.submit(
+                _fetch_league_teams,
+                provider,
+                league_slug,
+                sport,
+                self._get_league_metadata(league_slug),
+                provider_name == "espn",
+            )
+            futures[future] = (provider_name, league_slug)
 
-        logger.debug(
-            "[DISCOVERY] %s: %d leagues, %d teams",
-            provider_name,
-            len(leagues),
-            len(teams),
-        )
-        return leagues, teams
+        logger.debug("[DISCOVERY] %s: %d leagues submitted", provider_name, len(futures))
+        return futures
 
     def _infer_sport_from_league(self, league_slug: str) -> str:
         """Infer sport from league slug.
@@ -369,7 +391,7 @@ class CacheRefresher:
         """
         # Check database first (single source of truth)
         db_metadata = self._get_league_metadata(league_slug)
-        if db_metadata and db_metadata.get("sport"):
+        if db_metadata and db_metadata["sport"]:
             return db_metadata["sport"].lower()
 
         # Soccer leagues use dot notation (e.g., eng.1, ger.1)
@@ -407,7 +429,7 @@ class CacheRefresher:
             with httpx.Client(timeout=30) as client:
                 response = client.get(url)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
             # Extract league refs and fetch slugs
             league_refs = data.get("items", [])
@@ -420,8 +442,8 @@ class CacheRefresher:
                     with httpx.Client(timeout=10) as client:
                         resp = client.get(ref_url)
                         if resp.status_code == 200:
-                            return resp.json().get("slug")
-                except (httpx.RequestError, httpx.HTTPStatusError) as e:
+                            return orjson.loads(resp.content).get("slug")
+                except (httpx.RequestError, httpx.HTTPStatusError, orjson.JSONDecodeError) as e:
                     logger.debug(
                         "[CACHE_REFRESH] Failed to fetch league slug from %s: %s", ref_url, e
                     )
@@ -457,15 +479,7 @@ class CacheRefresher:
 
     def _should_include_soccer_league(self, slug: str) -> bool:
         """Filter out junk soccer leagues."""
-        skip_slugs = {"nonfifa", "usa.ncaa.m.1", "usa.ncaa.w.1"}
-        skip_patterns = ["not_used"]
-
-        if slug in skip_slugs:
-            return False
-        for pattern in skip_patterns:
-            if pattern in slug:
-                return False
-        return True
+        return slug not in SOCCER_SKIP_SLUGS and SOCCER_SKIP_PATTERN not in slug
 
     def _save_cache(self, teams: list[dict], leagues: list[dict]) -> None:
         """Save teams and leagues to database using batch inserts."""
@@ -556,18 +570,15 @@ class CacheRefresher:
         """
         now = datetime.utcnow().isoformat() + "Z"
 
-        for league in leagues:
-            league_slug = league["league_slug"]
-            team_count = league.get("team_count", 0)
-
-            cursor.execute(
-                """
-                UPDATE leagues
-                SET cached_team_count = ?, last_cache_refresh = ?
-                WHERE league_code = ?
-                """,
-                (team_count, now, league_slug),
-            )
+        # Single executemany inside the caller's transaction (one statement prepare)
+        cursor.executemany(
+            """
+            UPDATE leagues
+            SET cached_team_count = ?, last_cache_refresh = ?
+            WHERE league_code = ?
+            """,
+            [(league.get("team_count", 0), now, league["league_slug"]) for league in leagues],
+        )
 
     def _update_meta(
         self,
@@ -604,7 +615,7 @@ class CacheRefresher:
             )
 
     def _merge_with_seed(
-        self, api_teams: list[dict], api_leagues: list[dict]
+        self, api_teams: list[dict], api_leagues: list[dict], seed_data: dict | None
     ) -> tuple[list[dict], list[dict]]:
         """Merge API results with TSDB seed data.
 
@@ -616,13 +627,11 @@ class CacheRefresher:
         Args:
             api_teams: Teams fetched from providers
             api_leagues: Leagues fetched from providers
+            seed_data: Preloaded TSDB seed data (from load_tsdb_seed), or None
 
         Returns:
             (merged_teams, merged_leagues) tuple
         """
-        from teamarr.database.seed import load_tsdb_seed
-
-        seed_data = load_tsdb_seed()
         if not seed_data:
             return api_teams, api_leagues
 
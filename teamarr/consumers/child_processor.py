@@ -15,13 +15,25 @@ Usage:
 
 import logging
 import threading
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
 
+from teamarr.database.channels import (
+    add_streams_to_channels,
+    compile_exception_keywords,
+    find_parent_channel_for_event,
+    get_exception_keywords,
+    get_group_stream_pairs,
+    get_next_stream_priority,
+    log_channel_history_batch,
+    match_exception_keyword,
+)
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChildProcessResult:
     """Result of processing child group streams."""
 
@@ -84,14 +96,23 @@ class ChildStreamProcessor:
         """
         self._db_factory = db_factory
         self._channel_manager = channel_manager
-        self._dispatcharr_lock = threading.Lock()
+        # Per-channel locks so syncs to different channels don't serialize
+        self._channel_locks: dict[int, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
 
-        # Cache for exception keywords
+        # Cache for exception keywords (compiled once per run)
         self._exception_keywords: list | None = None
+        self._keyword_matcher: list | None = None
 
     def clear_caches(self) -> None:
         """Clear cached data (call at start of processing run)."""
         self._exception_keywords = None
+        self._keyword_matcher = None
+
+    def _get_channel_lock(self, dispatcharr_channel_id: int) -> threading.Lock:
+        """Get the lock guarding read-modify-write of one Dispatcharr channel."""
+        with self._locks_guard:
+            return self._channel_locks.setdefault(dispatcharr_channel_id, threading.Lock())
 
     def process_child_streams(
         self,
@@ -112,28 +133,56 @@ class ChildStreamProcessor:
         Returns:
             ChildProcessResult with streams added, skipped, errors
         """
-        from teamarr.database.channels import (
-            add_stream_to_channel,
-            check_exception_keyword,
-            find_parent_channel_for_event,
-            get_exception_keywords,
-            get_next_stream_priority,
-            log_channel_history,
-            stream_exists_on_channel,
-        )
-
         result = ChildProcessResult()
         child_group_id = child_group.get("id")
         child_group_name = child_group.get("name", "Unknown")
 
         try:
             with self._db_factory() as conn:
+                # Take the write lock up front so the reads below and the batched
+                # inserts share one transaction; busy_timeout covers contention
+                conn.execute("BEGIN IMMEDIATE")
+
                 # Load exception keywords (cached per run)
                 if self._exception_keywords is None:
                     self._exception_keywords = get_exception_keywords(conn)
+                    self._keyword_matcher = compile_exception_keywords(self._exception_keywords)
+
+                # Streams already on the parent's channels, loaded once for the batch
+                existing_pairs = get_group_stream_pairs(conn, parent_group_id)
+
+                # Inserts are buffered and flushed with executemany before commit,
+                # so priorities are tracked in-process per channel
+                next_priority: dict[int, int] = {}
+                pending_streams: list[dict] = []
+                pending_history: list[dict] = []
+                # Dispatcharr stream additions, coalesced per channel and synced after commit
+                pending_syncs: dict[int, list[int]] = defaultdict(list)
+
+                # Parent channel lookups memoized per (event, provider, keyword) for this batch
+                parent_channels: dict[tuple, Any] = {}
+
+                def lookup_parent_channel(
+                    event_id: str, event_provider: str, keyword: str | None
+                ) -> Any:
+                    key = (event_id, event_provider, keyword)
+                    if key not in parent_channels:
+                        parent_channels[key] = find_parent_channel_for_event(
+                            conn=conn,
+                            parent_group_id=parent_group_id,
+                            event_id=event_id,
+                            event_provider=event_provider,
+                            exception_keyword=keyword,
+                        )
+                    return parent_channels[key]
+
+                # Loop-invariant lookups bound to locals for the per-stream loop
+                keyword_matcher = self._keyword_matcher
+                sync_enabled = self._channel_manager is not None
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
                 for matched in matched_streams:
-                    stream = matched.get("stream", {})
+                    stream = matched.get("stream") or {}
                     event = matched.get("event")
 
                     if not event:
@@ -150,10 +199,13 @@ class ChildStreamProcessor:
                     event_id = event.id
                     event_provider = getattr(event, "provider", "espn")
 
-                    # Check exception keyword for routing
-                    matched_keyword, keyword_behavior = check_exception_keyword(
-                        stream_name, self._exception_keywords
-                    )
+                    # Check exception keyword for routing (skipped when none configured)
+                    if keyword_matcher:
+                        matched_keyword, keyword_behavior = match_exception_keyword(
+                            stream_name, keyword_matcher
+                        )
+                    else:
+                        matched_keyword = keyword_behavior = None
 
                     # Skip if keyword behavior is 'ignore'
                     if keyword_behavior == "ignore":
@@ -166,24 +218,14 @@ class ChildStreamProcessor:
                         continue
 
                     # Find parent's channel for this event
-                    parent_channel = find_parent_channel_for_event(
-                        conn=conn,
-                        parent_group_id=parent_group_id,
-                        event_id=event_id,
-                        event_provider=event_provider,
-                        exception_keyword=matched_keyword,
+                    parent_channel = lookup_parent_channel(
+                        event_id, event_provider, matched_keyword
                     )
 
                     # Fallback: if keyword matched but no keyword channel, try main
                     if not parent_channel and matched_keyword:
-                        parent_channel = find_parent_channel_for_event(
-                            conn=conn,
-                            parent_group_id=parent_group_id,
-                            event_id=event_id,
-                            event_provider=event_provider,
-                            exception_keyword=None,
-                        )
-                        if parent_channel:
+                        parent_channel = lookup_parent_channel(event_id, event_provider, None)
+                        if parent_channel and debug_enabled:
                             logger.debug(
                                 "[CHILD] Keyword channel not found for '%s', using main for %s",
                                 matched_keyword,
@@ -201,7 +243,7 @@ class ChildStreamProcessor:
                         continue
 
                     # Check if stream already exists on channel
-                    if stream_exists_on_channel(conn, parent_channel.id, stream_id):
+                    if (parent_channel.id, stream_id) in existing_pairs:
                         result.streams_existing.append(
                             {
                                 "stream": stream_name,
@@ -211,36 +253,42 @@ class ChildStreamProcessor:
                         )
                         continue
 
-                    # Add stream to database
+                    # Queue stream for database insert
                     # Use sequential priority - final ordering happens after all matching
-                    priority = get_next_stream_priority(conn, parent_channel.id)
-                    add_stream_to_channel(
-                        conn=conn,
-                        managed_channel_id=parent_channel.id,
-                        dispatcharr_stream_id=stream_id,
-                        stream_name=stream_name,
-                        priority=priority,
-                        source_group_id=child_group_id,
-                        source_group_type="child",
-                        exception_keyword=matched_keyword,
-                        m3u_account_id=stream.get("m3u_account_id"),
-                        m3u_account_name=stream.get("m3u_account_name"),
+                    priority = next_priority.get(parent_channel.id)
+                    if priority is None:
+                        priority = get_next_stream_priority(conn, parent_channel.id)
+                    next_priority[parent_channel.id] = priority + 1
+                    pending_streams.append(
+                        {
+                            "managed_channel_id": parent_channel.id,
+                            "dispatcharr_stream_id": stream_id,
+                            "stream_name": stream_name,
+                            "priority": priority,
+                            "source_group_id": child_group_id,
+                            "source_group_type": "child",
+                            "exception_keyword": matched_keyword,
+                            "m3u_account_id": stream.get("m3u_account_id"),
+                            "m3u_account_name": stream.get("m3u_account_name"),
+                        }
                     )
+                    existing_pairs.add((parent_channel.id, stream_id))
 
-                    # Sync to Dispatcharr if configured
-                    if self._channel_manager and parent_channel.dispatcharr_channel_id:
-                        self._sync_stream_to_dispatcharr(
-                            parent_channel.dispatcharr_channel_id,
-                            stream_id,
-                        )
+                    # Queue Dispatcharr sync if configured
+                    if sync_enabled and parent_channel.dispatcharr_channel_id:
+                        pending_syncs[parent_channel.dispatcharr_channel_id].append(stream_id)
 
-                    # Log history
-                    log_channel_history(
-                        conn=conn,
-                        managed_channel_id=parent_channel.id,
-                        change_type="stream_added",
-                        change_source="epg_generation",
-                        notes=f"Added stream '{stream_name}' from child group '{child_group_name}'",
+                    # Queue history entry
+                    pending_history.append(
+                        {
+                            "managed_channel_id": parent_channel.id,
+                            "change_type": "stream_added",
+                            "change_source": "epg_generation",
+                            "notes": (
+                                f"Added stream '{stream_name}' from child group "
+                                f"'{child_group_name}'"
+                            ),
+                        }
                     )
 
                     result.streams_added.append(
@@ -253,8 +301,14 @@ class ChildStreamProcessor:
                         }
                     )
 
+                add_streams_to_channels(conn, pending_streams)
+                log_channel_history_batch(conn, pending_history)
                 conn.commit()
 
+            # One update per Dispatcharr channel instead of one per stream
+            for dispatcharr_channel_id, stream_ids in pending_syncs.items():
+                self._sync_streams_to_dispatcharr(dispatcharr_channel_id, stream_ids)
+
         except Exception as e:
             logger.exception("[CHILD_ERROR] %s: %s", child_group_name, e)
             result.errors.append({"error": str(e)})
@@ -270,16 +324,16 @@ class ChildStreamProcessor:
 
         return result
 
-    def _sync_stream_to_dispatcharr(
+    def _sync_streams_to_dispatcharr(
         self,
         dispatcharr_channel_id: int,
-        stream_id: int,
+        stream_ids: list[int],
     ) -> bool:
-        """Add stream to channel in Dispatcharr.
+        """Add streams to a channel in Dispatcharr with a single update.
 
         Args:
             dispatcharr_channel_id: Dispatcharr channel ID
-            stream_id: Stream ID to add
+            stream_ids: Stream IDs to add (in priority order)
 
         Returns:
             True if synced successfully
@@ -288,27 +342,35 @@ class ChildStreamProcessor:
             return False
 
         try:
-            with self._dispatcharr_lock:
-                channel = self._channel_manager.get_channel(dispatcharr_channel_id)
-                if not channel:
-                    logger.warning(
-                        "[CHILD] Channel %d not found in Dispatcharr", dispatcharr_channel_id
-                    )
-                    return False
+            # Lookup outside the lock - may populate the channel cache over the network
+            channel = self._channel_manager.get_channel(dispatcharr_channel_id)
+            if not channel:
+                logger.warning(
+                    "[CHILD] Channel %d not found in Dispatcharr", dispatcharr_channel_id
+                )
+                return False
+
+            if channel.streams and all(sid in channel.streams for sid in stream_ids):
+                return True  # Already exist
 
+            with self._get_channel_lock(dispatcharr_channel_id):
+                # Re-read under the lock (cache hit) so concurrent adds aren't lost
+                channel = self._channel_manager.get_channel(dispatcharr_channel_id) or channel
                 current_streams = list(channel.streams) if channel.streams else []
 
-                if stream_id in current_streams:
-                    return True  # Already exists
+                new_streams = current_streams + [
+                    sid for sid in dict.fromkeys(stream_ids) if sid not in current_streams
+                ]
+                if new_streams == current_streams:
+                    return True  # Added concurrently
 
-                current_streams.append(stream_id)
                 result = self._channel_manager.update_channel(
                     dispatcharr_channel_id,
-                    {"streams": current_streams},
+                    {"streams": new_streams},
                 )
 
-                return result.success if hasattr(result, "success") else bool(result)
+                return result.success
 
         except Exception as e:
-            logger.warning("[CHILD] Failed to sync stream to Dispatcharr: %s", e)
+            logger.warning("[CHILD] Failed to sync streams to Dispatcharr: %s", e)
             return False
@@ -136,6 +136,9 @@ class CrossGroupEnforcer:
                     logger.debug("[CROSS_GROUP] No multi-league groups to check")
                     return result
 
+                # Next stream priority per target channel (one MAX query per channel)
+                next_priority: dict[int, int] = {}
+
                 # For each multi-league group's channels
                 for group_id, group in multi_league_groups.items():
                     # Check overlap_handling mode
@@ -193,7 +196,10 @@ class CrossGroupEnforcer:
                                     continue  # Already on target
 
                                 # Use sequential priority - final ordering after all matching
-                                priority = get_next_stream_priority(conn, target_channel.id)
+                                priority = next_priority.get(target_channel.id)
+                                if priority is None:
+                                    priority = get_next_stream_priority(conn, target_channel.id)
+                                next_priority[target_channel.id] = priority + 1
                                 add_stream_to_channel(
                                     conn=conn,
                                     managed_channel_id=target_channel.id,
@@ -9,6 +9,7 @@ import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
@@ -115,9 +116,9 @@ def run_full_generation(
         process_all_event_groups,
         process_all_teams,
     )
-    from teamarr.consumers.team_processor import get_all_team_xmltv
+    from teamarr.consumers.team_processor import iter_all_team_xmltv
     from teamarr.database.channels import cleanup_old_history, get_reconciliation_settings
-    from teamarr.database.groups import get_all_group_xmltv
+    from teamarr.database.groups import iter_all_group_xmltv
     from teamarr.database.settings import (
         get_dispatcharr_settings,
         get_display_settings,
@@ -126,7 +127,7 @@ def run_full_generation(
     from teamarr.database.stats import create_run, save_run
     from teamarr.dispatcharr import EPGManager
     from teamarr.services import create_default_service
-    from teamarr.utilities.xmltv import merge_xmltv_content
+    from teamarr.utilities.xmltv import merge_xmltv_content, write_xmltv_file
 
     result = GenerationResult()
     result.started_at = time.time()
@@ -434,26 +435,26 @@ def run_full_generation(
         # Step 4: Merge and save XMLTV (95-96%)
         update_progress("saving", 95, "Saving XMLTV...")
 
-        xmltv_contents: list[str] = []
-        with db_factory() as conn:
-            team_xmltv = get_all_team_xmltv(conn)
-            xmltv_contents.extend(team_xmltv)
-            group_xmltv = get_all_group_xmltv(conn)
-            xmltv_contents.extend(group_xmltv)
-
         output_path = settings.epg_output_path
-        if xmltv_contents and output_path:
-            merged_xmltv = merge_xmltv_content(
-                xmltv_contents,
-                generator_name=display_settings.xmltv_generator_name,
-                generator_url=display_settings.xmltv_generator_url,
-            )
+        merged_xmltv = None
+        if output_path:
+            # Rows are streamed into the merge, so only one stored document
+            # is held as a string at a time
+            with db_factory() as conn:
+                xmltv_contents = chain(iter_all_team_xmltv(conn), iter_all_group_xmltv(conn))
+                first_content = next(xmltv_contents, None)
+                if first_content is not None:
+                    merged_xmltv = merge_xmltv_content(
+                        chain((first_content,), xmltv_contents),
+                        generator_name=display_settings.xmltv_generator_name,
+                        generator_url=display_settings.xmltv_generator_url,
+                    )
+
+        if merged_xmltv is not None:
             output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(merged_xmltv, encoding="utf-8")
+            result.file_size = write_xmltv_file(merged_xmltv, output_file)
             result.file_written = True
             result.file_path = str(output_file.absolute())
-            result.file_size = len(merged_xmltv)
             logger.info(
                 "[GENERATION] EPG written to %s (%s bytes)", output_path, f"{result.file_size:,}"
             )
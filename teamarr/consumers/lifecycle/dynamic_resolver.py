@@ -5,6 +5,7 @@ Auto-creates groups/profiles in Dispatcharr if they don't exist.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from sqlite3 import Connection as SQLiteConnection
 from typing import Any
@@ -14,7 +15,7 @@ from teamarr.core.sports import get_sport_display_names_from_db
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicResolver:
     """Resolves dynamic channel groups and profiles.
 
@@ -33,6 +34,10 @@ class DynamicResolver:
     _sport_display_names: dict[str, str] = field(default_factory=dict)
     _league_display_names: dict[str, str] = field(default_factory=dict)
     _league_aliases: dict[str, str] = field(default_factory=dict)
+    # Names whose create failed this batch (not retried until initialize())
+    _failed_groups: set[str] = field(default_factory=set)
+    _failed_profiles: set[str] = field(default_factory=set)
+    _dispatcharr: Any = None
     _initialized: bool = False
 
     def initialize(
@@ -54,12 +59,25 @@ class DynamicResolver:
         self._sport_display_names = {}
         self._league_display_names = {}
         self._league_aliases = {}
+        self._failed_groups = set()
+        self._failed_profiles = set()
+        self._dispatcharr = None
 
     def _ensure_initialized(self) -> None:
         """Lazy initialization of caches."""
         if self._initialized:
             return
 
+        # Load existing Dispatcharr groups and profiles concurrently, overlapping
+        # with the database reads below. Connection is kept for get-or-create
+        # calls during the batch
+        dispatcharr = self._dispatcharr = self._get_dispatcharr()
+        executor = ThreadPoolExecutor(max_workers=2) if dispatcharr else None
+        if executor:
+            groups_future = executor.submit(dispatcharr.m3u.list_groups)
+            profiles_future = executor.submit(dispatcharr.channels.list_profiles)
+            executor.shutdown(wait=False)
+
         # Load sport display names
         if self._db_conn:
             self._sport_display_names = get_sport_display_names_from_db(self._db_conn)
@@ -67,29 +85,24 @@ class DynamicResolver:
             cursor = self._db_conn.execute(
                 "SELECT league_code, display_name, league_alias FROM leagues"
             )
-            for row in cursor.fetchall():
+            # Iterate the cursor directly rather than materializing fetchall()
+            for row in cursor:
                 self._league_display_names[row["league_code"]] = row["display_name"]
                 # league_alias with fallback to display_name (matches {league} template variable)
                 alias = row["league_alias"] or row["display_name"]
                 if alias:
                     self._league_aliases[row["league_code"]] = alias
 
-        # Load existing Dispatcharr groups and profiles
-        dispatcharr = self._get_dispatcharr()
-        if dispatcharr:
+        if executor:
             try:
-                groups = dispatcharr.m3u.list_groups()
-                for g in groups:
-                    if g.name and g.id:
-                        self._groups_by_name[g.name.lower()] = g.id
+                groups = groups_future.result()
+                self._groups_by_name = {g.name.lower(): g.id for g in groups if g.name and g.id}
             except Exception as e:
                 logger.warning("[RESOLVER] Failed to fetch channel groups: %s", e)
 
             try:
-                profiles = dispatcharr.channels.list_profiles()
-                for p in profiles:
-                    if p.name and p.id:
-                        self._profiles_by_name[p.name.lower()] = p.id
+                profiles = profiles_future.result()
+                self._profiles_by_name = {p.name.lower(): p.id for p in profiles if p.name and p.id}
             except Exception as e:
                 logger.warning("[RESOLVER] Failed to fetch channel profiles: %s", e)
 
@@ -186,11 +199,14 @@ class DynamicResolver:
         # Check cache
         if name_lower in self._groups_by_name:
             return self._groups_by_name[name_lower]
+        if name_lower in self._failed_groups:
+            return None
 
         # Create new group
-        dispatcharr = self._get_dispatcharr()
+        dispatcharr = self._dispatcharr or self._get_dispatcharr()
         if not dispatcharr:
             logger.warning("[RESOLVER] Cannot create group '%s': Dispatcharr not connected", name)
+            self._failed_groups.add(name_lower)
             return None
 
         try:
@@ -206,6 +222,7 @@ class DynamicResolver:
         except Exception as e:
             logger.warning("[RESOLVER] Error creating group '%s': %s", name, e)
 
+        self._failed_groups.add(name_lower)
         return None
 
     def _get_or_create_profile(self, name: str) -> int | None:
@@ -223,11 +240,14 @@ class DynamicResolver:
         # Check cache
         if name_lower in self._profiles_by_name:
             return self._profiles_by_name[name_lower]
+        if name_lower in self._failed_profiles:
+            return None
 
         # Create new profile
-        dispatcharr = self._get_dispatcharr()
+        dispatcharr = self._dispatcharr or self._get_dispatcharr()
         if not dispatcharr:
             logger.warning("[RESOLVER] Cannot create profile '%s': Dispatcharr not connected", name)
+            self._failed_profiles.add(name_lower)
             return None
 
         try:
@@ -243,6 +263,7 @@ class DynamicResolver:
         except Exception as e:
             logger.warning("[RESOLVER] Error creating profile '%s': %s", name, e)
 
+        self._failed_profiles.add(name_lower)
         return None
 
     def resolve_channel_group(
@@ -343,36 +364,45 @@ class DynamicResolver:
             return []
 
         resolved: list[int] = []
+        seen: set[int] = set()
 
         for item in profile_ids:
-            if isinstance(item, int):
+            if type(item) is int:
                 # Static profile ID
-                resolved.append(item)
-            elif isinstance(item, str):
-                if item.isdigit():
-                    # String that's actually a number
-                    resolved.append(int(item))
-                elif "{" in item:
-                    # Pattern - resolve it
-                    resolved_name = self.resolve_pattern(item, event_sport, event_league)
-
-                    # Check if wildcards remain unresolved
-                    if "{sport}" in resolved_name or "{league}" in resolved_name:
-                        logger.warning(
-                            "[RESOLVER] Profile pattern has unresolved wildcards: %s -> %s",
-                            item,
-                            resolved_name,
-                        )
-                        continue  # Skip this pattern
-
-                    pid = self._get_or_create_profile(resolved_name)
-                    if pid and pid not in resolved:
-                        resolved.append(pid)
-                        logger.debug(
-                            "[RESOLVER] Profile pattern: %s -> '%s' -> id=%s",
-                            item,
-                            resolved_name,
-                            pid,
-                        )
+                pid = item
+            elif not isinstance(item, str):
+                continue
+            elif item.isdigit():
+                # String that's actually a number
+                pid = int(item)
+            elif "{" in item:
+                # Pattern - resolve it
+                resolved_name = self.resolve_pattern(item, event_sport, event_league)
+
+                # Check if wildcards remain unresolved
+                if "{sport}" in resolved_name or "{league}" in resolved_name:
+                    logger.warning(
+                        "[RESOLVER] Profile pattern has unresolved wildcards: %s -> %s",
+                        item,
+                        resolved_name,
+                    )
+                    continue  # Skip this pattern
+
+                pid = self._get_or_create_profile(resolved_name)
+                if not pid:
+                    continue
+                logger.debug(
+                    "[RESOLVER] Profile pattern: %s -> '%s' -> id=%s",
+                    item,
+                    resolved_name,
+                    pid,
+                )
+            else:
+                continue
+
+            # Set-based dedup keeps first-seen order
+            if pid not in seen:
+                seen.add(pid)
+                resolved.append(pid)
 
         return resolved
@@ -351,6 +351,9 @@ class ChannelLifecycleService:
                     dispatcharr_settings = get_dispatcharr_settings(conn)
                     stream_profile_id = dispatcharr_settings.default_stream_profile_id
 
+                # All timing checks in this batch share one "now"
+                self._timing_manager.begin_sweep()
+
                 for matched in matched_streams:
                     stream = matched.get("stream", {})
                     event = matched.get("event")
@@ -593,6 +596,8 @@ class ChannelLifecycleService:
                     "[LIFECYCLE] Failed to apply pending profile changes after error: %s",
                     profile_err,
                 )
+        finally:
+            self._timing_manager.end_sweep()
 
         return result
 
@@ -16,19 +16,98 @@ Delete timing options:
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
 
 from teamarr.consumers.matching.result import ExcludedReason
 from teamarr.core import Event
 from teamarr.utilities.event_status import is_event_final
 from teamarr.utilities.sports import get_sport_duration
 from teamarr.utilities.time_blocks import crosses_midnight
-from teamarr.utilities.tz import now_user, to_user_tz
+from teamarr.utilities.tz import get_user_timezone, now_user, to_user_tz
 
 from .types import CreateTiming, DeleteTiming, LifecycleDecision
 
 logger = logging.getLogger(__name__)
 
+# Threshold display format, shared by decision reasons and debug logs
+_THRESHOLD_FORMAT = "%m/%d %I:%M %p"
+
+_NO_OFFSET = timedelta(0)
+_ONE_DAY = timedelta(days=1)
+_TWO_DAYS = timedelta(days=2)
+_THREE_DAYS = timedelta(days=3)
+_ONE_WEEK = timedelta(days=7)
+_SIX_HOURS = timedelta(hours=6)
+
+# Buffer after event end before a non-final status is treated as stale
+_FINAL_FALLBACK_BUFFER = timedelta(hours=2)
+
+# Offsets back from the start of the event day
+_CREATE_OFFSETS = {
+    "same_day": _NO_OFFSET,
+    "day_before": _ONE_DAY,
+    "2_days_before": _TWO_DAYS,
+    "3_days_before": _THREE_DAYS,
+    "1_week_before": _ONE_WEEK,
+}
+
+# Offsets forward from the end of the event's END day
+_DELETE_OFFSETS = {
+    "same_day": _NO_OFFSET,
+    "day_after": _ONE_DAY,
+    "2_days_after": _TWO_DAYS,
+    "3_days_after": _THREE_DAYS,
+    "1_week_after": _ONE_WEEK,
+}
+
+
+@lru_cache(maxsize=8192)
+def _compute_create_threshold(
+    start_time: datetime, user_tz: tzinfo, create_timing: str
+) -> datetime:
+    """Calculate when a channel should be created.
+
+    Cached across lifecycle sweeps; the user timezone is part of the key so
+    a timezone change never returns stale thresholds.
+    """
+    if start_time.tzinfo is None:
+        raise ValueError("Cannot convert naive datetime - must be timezone-aware")
+    event_start = start_time.astimezone(user_tz)
+
+    # Start of event day (midnight)
+    day_start = event_start.replace(hour=0, minute=0, second=0, microsecond=0)
+    return day_start - _CREATE_OFFSETS.get(create_timing, _NO_OFFSET)
+
+
+@lru_cache(maxsize=8192)
+def _compute_delete_threshold(
+    start_time: datetime, user_tz: tzinfo, duration_hours: float, delete_timing: str
+) -> datetime | None:
+    """Calculate when a channel should be deleted.
+
+    Uses event END date for midnight-crossing games. Cached like
+    _compute_create_threshold().
+    """
+    if start_time.tzinfo is None:
+        raise ValueError("Cannot convert naive datetime - must be timezone-aware")
+    event_start = start_time.astimezone(user_tz)
+    event_end = event_start + timedelta(hours=duration_hours)
+
+    if delete_timing == "6_hours_after":
+        return event_end + _SIX_HOURS
+
+    offset = _DELETE_OFFSETS.get(delete_timing)
+    if offset is None:
+        return None
+
+    # End of END day (23:59:59) - important for midnight-crossing games
+    day_end = datetime.combine(
+        event_end.date(),
+        datetime.max.time(),
+    ).replace(tzinfo=event_end.tzinfo)
+    return day_end + offset
+
 
 class ChannelLifecycleManager:
     """Manages event channel creation and deletion timing.
@@ -51,6 +130,14 @@ class ChannelLifecycleManager:
         decision = manager.should_delete_channel(event)
         if decision.should_act:
             delete_channel(event)
+
+        # Batch callers pin one "now" for all checks
+        manager.begin_sweep()
+        try:
+            for event in events:
+                manager.categorize_event_timing(event)
+        finally:
+            manager.end_sweep()
     """
 
     def __init__(
@@ -67,16 +154,33 @@ class ChannelLifecycleManager:
         self.sport_durations = sport_durations or {}
         self.include_final_events = include_final_events
 
+        # Shared "now" for the current sweep (see begin_sweep)
+        self._now: datetime | None = None
+
+    def begin_sweep(self) -> None:
+        """Pin the current time for a batch of lifecycle checks.
+
+        Every check in the sweep observes the same logical "now" instead of
+        building a tz-aware datetime per call. Pair with end_sweep().
+        """
+        self._now = now_user()
+
+    def end_sweep(self) -> None:
+        """Release the time pinned by begin_sweep()."""
+        self._now = None
+
     def should_create_channel(
         self,
         event: Event,
         stream_exists: bool = False,
+        now: datetime | None = None,
     ) -> LifecycleDecision:
         """Determine if a channel should be created for this event.
 
         Args:
             event: The event to check
             stream_exists: Whether a matching stream currently exists
+            now: Current time (defaults to the sweep time, else now_user())
 
         Returns:
             LifecycleDecision with should_act and reason
@@ -90,42 +194,35 @@ class ChannelLifecycleManager:
 
         # Calculate create threshold
         create_threshold = self._calculate_create_threshold(event)
-        now = now_user()
+        now = now or self._now or now_user()
 
         # Check if we're past delete threshold (prevents create-then-delete)
         delete_threshold = self._calculate_delete_threshold(event)
         if delete_threshold and now >= delete_threshold:
+            threshold_str = delete_threshold.strftime(_THRESHOLD_FORMAT)
             logger.debug(
-                "[SKIP CREATE] event=%s: past delete threshold (%s)",
-                event.id,
-                delete_threshold.strftime("%m/%d %I:%M %p"),
+                "[SKIP CREATE] event=%s: past delete threshold (%s)", event.id, threshold_str
             )
             return LifecycleDecision(
                 False,
-                f"Past delete threshold ({delete_threshold.strftime('%m/%d %I:%M %p')})",
+                f"Past delete threshold ({threshold_str})",
                 delete_threshold,
             )
 
         if now >= create_threshold:
-            logger.debug(
-                "[CREATED] event=%s: threshold reached (%s)",
-                event.id,
-                create_threshold.strftime("%m/%d %I:%M %p"),
-            )
+            threshold_str = create_threshold.strftime(_THRESHOLD_FORMAT)
+            logger.debug("[CREATED] event=%s: threshold reached (%s)", event.id, threshold_str)
             return LifecycleDecision(
                 True,
-                f"Create threshold reached ({create_threshold.strftime('%m/%d %I:%M %p')})",
+                f"Create threshold reached ({threshold_str})",
                 create_threshold,
             )
 
-        logger.debug(
-            "[SKIP CREATE] event=%s: before threshold (%s)",
-            event.id,
-            create_threshold.strftime("%m/%d %I:%M %p"),
-        )
+        threshold_str = create_threshold.strftime(_THRESHOLD_FORMAT)
+        logger.debug("[SKIP CREATE] event=%s: before threshold (%s)", event.id, threshold_str)
         return LifecycleDecision(
             False,
-            f"Before create threshold ({create_threshold.strftime('%m/%d %I:%M %p')})",
+            f"Before create threshold ({threshold_str})",
             create_threshold,
         )
 
@@ -133,12 +230,14 @@ class ChannelLifecycleManager:
         self,
         event: Event,
         stream_exists: bool = True,
+        now: datetime | None = None,
     ) -> LifecycleDecision:
         """Determine if a channel should be deleted for this event.
 
         Args:
             event: The event to check
             stream_exists: Whether a matching stream currently exists
+            now: Current time (defaults to the sweep time, else now_user())
 
         Returns:
             LifecycleDecision with should_act and reason
@@ -156,47 +255,28 @@ class ChannelLifecycleManager:
             logger.debug("[SKIP DELETE] event=%s: could not calculate delete time", event.id)
             return LifecycleDecision(False, "Could not calculate delete time")
 
-        now = now_user()
+        now = now or self._now or now_user()
 
         if now >= delete_threshold:
-            logger.debug(
-                "[DELETED] event=%s: threshold reached (%s)",
-                event.id,
-                delete_threshold.strftime("%m/%d %I:%M %p"),
-            )
+            threshold_str = delete_threshold.strftime(_THRESHOLD_FORMAT)
+            logger.debug("[DELETED] event=%s: threshold reached (%s)", event.id, threshold_str)
             return LifecycleDecision(
                 True,
-                f"Delete threshold reached ({delete_threshold.strftime('%m/%d %I:%M %p')})",
+                f"Delete threshold reached ({threshold_str})",
                 delete_threshold,
             )
 
-        logger.debug(
-            "[SKIP DELETE] event=%s: before threshold (%s)",
-            event.id,
-            delete_threshold.strftime("%m/%d %I:%M %p"),
-        )
+        threshold_str = delete_threshold.strftime(_THRESHOLD_FORMAT)
+        logger.debug("[SKIP DELETE] event=%s: before threshold (%s)", event.id, threshold_str)
         return LifecycleDecision(
             False,
-            f"Before delete threshold ({delete_threshold.strftime('%m/%d %I:%M %p')})",
+            f"Before delete threshold ({threshold_str})",
             delete_threshold,
         )
 
     def _calculate_create_threshold(self, event: Event) -> datetime:
         """Calculate when channel should be created."""
-        event_start = to_user_tz(event.start_time)
-
-        # Start of event day (midnight)
-        day_start = event_start.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        timing_map = {
-            "same_day": day_start,
-            "day_before": day_start - timedelta(days=1),
-            "2_days_before": day_start - timedelta(days=2),
-            "3_days_before": day_start - timedelta(days=3),
-            "1_week_before": day_start - timedelta(days=7),
-        }
-
-        return timing_map.get(self.create_timing, day_start)
+        return _compute_create_threshold(event.start_time, get_user_timezone(), self.create_timing)
 
     def _calculate_delete_threshold(self, event: Event) -> datetime | None:
         """Calculate when channel should be deleted.
@@ -204,31 +284,12 @@ class ChannelLifecycleManager:
         Uses event END date for midnight-crossing games.
         Uses sport-specific duration when available.
         """
-        event_start = to_user_tz(event.start_time)
         duration_hours = get_sport_duration(
             event.sport, self.sport_durations, self.default_duration_hours
         )
-        event_end = event_start + timedelta(hours=duration_hours)
-
-        # Use END date (important for midnight-crossing games)
-        end_date = event_end.date()
-
-        # End of day (23:59:59)
-        day_end = datetime.combine(
-            end_date,
-            datetime.max.time(),
-        ).replace(tzinfo=event_end.tzinfo)
-
-        timing_map = {
-            "6_hours_after": event_end + timedelta(hours=6),
-            "same_day": day_end,
-            "day_after": day_end + timedelta(days=1),
-            "2_days_after": day_end + timedelta(days=2),
-            "3_days_after": day_end + timedelta(days=3),
-            "1_week_after": day_end + timedelta(days=7),
-        }
-
-        return timing_map.get(self.delete_timing)
+        return _compute_delete_threshold(
+            event.start_time, get_user_timezone(), duration_hours, self.delete_timing
+        )
 
     def calculate_delete_time(self, event: Event) -> datetime | None:
         """Calculate scheduled delete time for an event."""
@@ -236,18 +297,23 @@ class ChannelLifecycleManager:
 
     def get_event_end_time(self, event: Event) -> datetime:
         """Calculate estimated event end time using sport-specific duration."""
-        duration_hours = get_sport_duration(
-            event.sport, self.sport_durations, self.default_duration_hours
-        )
-        return to_user_tz(event.start_time) + timedelta(hours=duration_hours)
+        return self._event_end_from_start(event, to_user_tz(event.start_time))
 
     def event_crosses_midnight(self, event: Event) -> bool:
         """Check if event crosses midnight."""
         start = to_user_tz(event.start_time)
-        end = self.get_event_end_time(event)
-        return crosses_midnight(start, end)
+        return crosses_midnight(start, self._event_end_from_start(event, start))
+
+    def _event_end_from_start(self, event: Event, start: datetime) -> datetime:
+        """Event end for an already-converted start time."""
+        duration_hours = get_sport_duration(
+            event.sport, self.sport_durations, self.default_duration_hours
+        )
+        return start + timedelta(hours=duration_hours)
 
-    def categorize_event_timing(self, event: Event) -> ExcludedReason | None:
+    def categorize_event_timing(
+        self, event: Event, now: datetime | None = None
+    ) -> ExcludedReason | None:
         """Categorize why a matched event would be excluded.
 
         This is called AFTER successful matching to determine if the event
@@ -262,11 +328,12 @@ class ChannelLifecycleManager:
 
         Args:
             event: The matched event to categorize
+            now: Current time (defaults to the sweep time, else now_user())
 
         Returns:
             ExcludedReason if event should be excluded, None if eligible
         """
-        now = now_user()
+        now = now or self._now or now_user()
 
         # Calculate lifecycle window thresholds
         delete_threshold = self._calculate_delete_threshold(event)
@@ -277,17 +344,21 @@ class ChannelLifecycleManager:
         )
 
         # Detailed logging for debugging lifecycle timing issues
-        event_end = self.get_event_end_time(event)
-        status_state = event.status.state if event.status else "N/A"
-        logger.debug(
-            "[LIFECYCLE] event=%s start=%s end=%s status=%s delete_threshold=%s now=%s",
-            event.id,
-            event.start_time.strftime("%m/%d %H:%M") if event.start_time else "N/A",
-            event_end.strftime("%m/%d %H:%M") if event_end else "N/A",
-            status_state,
-            delete_threshold.strftime("%m/%d %H:%M") if delete_threshold else "N/A",
-            now.strftime("%m/%d %H:%M"),
-        )
+        # (the strftime arguments run eagerly, so skip them unless DEBUG is on)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        event_end = None
+        if debug_enabled:
+            event_end = self.get_event_end_time(event)
+            status_state = event.status.state if event.status else "N/A"
+            logger.debug(
+                "[LIFECYCLE] event=%s start=%s end=%s status=%s delete_threshold=%s now=%s",
+                event.id,
+                event.start_time.strftime("%m/%d %H:%M") if event.start_time else "N/A",
+                event_end.strftime("%m/%d %H:%M") if event_end else "N/A",
+                status_state,
+                delete_threshold.strftime("%m/%d %H:%M") if delete_threshold else "N/A",
+                now.strftime("%m/%d %H:%M"),
+            )
 
         # Check if we're past delete threshold (event lifecycle is over)
         if delete_threshold and now >= delete_threshold:
@@ -309,16 +380,19 @@ class ChannelLifecycleManager:
         # Time-based fallback: if event end + 2hr buffer is in past, treat as final
         # This catches stale cached events that still show old status
         if not final:
-            event_end_with_buffer = event_end + timedelta(hours=2)
+            if event_end is None:
+                event_end = self.get_event_end_time(event)
+            event_end_with_buffer = event_end + _FINAL_FALLBACK_BUFFER
             if now > event_end_with_buffer:
                 final = True
                 final_source = "time_fallback"
-                logger.debug(
-                    "[LIFECYCLE] event=%s: time fallback triggered (end+2hr=%s < now=%s)",
-                    event.id,
-                    event_end_with_buffer.strftime("%m/%d %H:%M"),
-                    now.strftime("%m/%d %H:%M"),
-                )
+                if debug_enabled:
+                    logger.debug(
+                        "[LIFECYCLE] event=%s: time fallback triggered (end+2hr=%s < now=%s)",
+                        event.id,
+                        event_end_with_buffer.strftime("%m/%d %H:%M"),
+                        now.strftime("%m/%d %H:%M"),
+                    )
 
         # Final events within lifecycle window → honor include_final_events setting
         if final and not self.include_final_events:
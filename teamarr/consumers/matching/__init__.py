@@ -35,6 +35,7 @@ from teamarr.consumers.matching.normalizer import (
     NormalizedStream,
     normalize_for_matching,
     normalize_stream,
+    normalize_streams,
 )
 from teamarr.consumers.matching.result import (
     FailedReason,
@@ -69,6 +70,7 @@ __all__ = [
     # Normalizer
     "NormalizedStream",
     "normalize_stream",
+    "normalize_streams",
     "normalize_for_matching",
     # Classifier
     "StreamCategory",
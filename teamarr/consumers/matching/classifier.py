@@ -9,12 +9,16 @@ strategy to use:
 
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date, time
 from enum import Enum
 from re import Pattern
 
-from teamarr.consumers.matching.normalizer import NormalizedStream, normalize_stream
+from teamarr.consumers.matching.normalizer import (
+    NormalizedStream,
+    normalize_stream,
+    normalize_streams,
+)
 from teamarr.services.detection_keywords import DetectionKeywordService
 
 logger = logging.getLogger(__name__)
@@ -355,38 +359,39 @@ def extract_date_with_custom_regex(
     return None
 
 
+# Month names and abbreviations for custom regex month groups
+_MONTH_LOOKUP = {
+    "jan": 1,
+    "january": 1,
+    "feb": 2,
+    "february": 2,
+    "mar": 3,
+    "march": 3,
+    "apr": 4,
+    "april": 4,
+    "may": 5,
+    "jun": 6,
+    "june": 6,
+    "jul": 7,
+    "july": 7,
+    "aug": 8,
+    "august": 8,
+    "sep": 9,
+    "sept": 9,
+    "september": 9,
+    "oct": 10,
+    "october": 10,
+    "nov": 11,
+    "november": 11,
+    "dec": 12,
+    "december": 12,
+}
+
+
 def _parse_month(month_str: str) -> int:
     """Parse month from string (name or number)."""
-    month_names = {
-        "jan": 1,
-        "january": 1,
-        "feb": 2,
-        "february": 2,
-        "mar": 3,
-        "march": 3,
-        "apr": 4,
-        "april": 4,
-        "may": 5,
-        "jun": 6,
-        "june": 6,
-        "jul": 7,
-        "july": 7,
-        "aug": 8,
-        "august": 8,
-        "sep": 9,
-        "sept": 9,
-        "september": 9,
-        "oct": 10,
-        "october": 10,
-        "nov": 11,
-        "november": 11,
-        "dec": 12,
-        "december": 12,
-    }
-    month_lower = month_str.lower()
-    if month_lower in month_names:
-        return month_names[month_lower]
-    return int(month_str)
+    month = _MONTH_LOOKUP.get(month_str.lower())
+    return month if month is not None else int(month_str)
 
 
 def _parse_date_string(date_str: str) -> date | None:
@@ -1075,6 +1080,7 @@ def classify_stream(
     stream_name: str,
     league_event_type: str | None = None,
     custom_regex: CustomRegexConfig | None = None,
+    normalized: NormalizedStream | None = None,
 ) -> ClassifiedStream:
     """Classify a stream for matching strategy selection.
 
@@ -1094,12 +1100,15 @@ def classify_stream(
         stream_name: Raw stream name to classify
         league_event_type: Optional event_type from leagues table (e.g., "fight" for UFC)
         custom_regex: Optional custom regex configuration for team/date/time extraction
+        normalized: Pre-computed normalize_stream() result for stream_name (e.g. from
+            normalize_streams); normalized here when None
 
     Returns:
         ClassifiedStream with category and extracted info
     """
     # Step 1: Normalize
-    normalized = normalize_stream(stream_name)
+    if normalized is None:
+        normalized = normalize_stream(stream_name)
     result: ClassifiedStream | None = None
 
     # Step 1b: Apply custom date/time regex to override built-in extraction
@@ -1108,7 +1117,7 @@ def classify_stream(
         if custom_regex.date_enabled:
             custom_date = extract_date_with_custom_regex(stream_name, custom_regex)
             if custom_date:
-                normalized.extracted_date = custom_date
+                normalized = replace(normalized, extracted_date=custom_date)
                 logger.debug(
                     "[CLASSIFY] Custom date regex extracted: %s from '%s'",
                     custom_date,
@@ -1118,7 +1127,7 @@ def classify_stream(
         if custom_regex.time_enabled:
             custom_time = extract_time_with_custom_regex(stream_name, custom_regex)
             if custom_time:
-                normalized.extracted_time = custom_time
+                normalized = replace(normalized, extracted_time=custom_time)
                 logger.debug(
                     "[CLASSIFY] Custom time regex extracted: %s from '%s'",
                     custom_time,
@@ -1274,4 +1283,7 @@ def classify_streams(
     Returns:
         List of ClassifiedStream objects
     """
-    return [classify_stream(name, league_event_type, custom_regex) for name in stream_names]
+    return [
+        classify_stream(name, league_event_type, custom_regex, normalized)
+        for name, normalized in zip(stream_names, normalize_streams(stream_names), strict=True)
+    ]
@@ -11,9 +11,10 @@ import logging
 import re
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from teamarr.consumers.matching.classifier import ClassifiedStream, StreamCategory
 from teamarr.consumers.matching.result import (
@@ -22,7 +23,11 @@ from teamarr.consumers.matching.result import (
     MatchMethod,
     MatchOutcome,
 )
-from teamarr.consumers.stream_match_cache import StreamMatchCache, event_to_cache_data
+from teamarr.consumers.stream_match_cache import (
+    StreamMatchCache,
+    cache_data_to_event,
+    event_to_cache_data,
+)
 from teamarr.core.types import Event
 from teamarr.services.sports_data import SportsDataService
 from teamarr.utilities.fuzzy_match import normalize_text
@@ -33,8 +38,41 @@ logger = logging.getLogger(__name__)
 # Same threshold used for team matching in team_matcher.py
 FIGHTER_MATCH_THRESHOLD = 75
 
+# Event number patterns: UFC 315, UFC FN 45 / PFL 5, Bellator 300
+_UFC_EVENT_RE = re.compile(r"(ufc\s*(?:fn|fight\s*night)?\s*\d+)", re.IGNORECASE)
+_OTHER_EVENT_RE = re.compile(r"((?:pfl|bellator|one\s*fc)\s*\d+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _event_number_pattern(event_num: str) -> re.Pattern:
+    """Word-bounded pattern for an event number, compiled once per number."""
+    return re.compile(r"\b" + re.escape(event_num) + r"\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_fighter_name(name: str) -> str:
+    """normalize_text() for event fighter names, shared across streams."""
+    return normalize_text(name) if name else ""
+
+
+def _prepare_fighter_names(events: list[Event]) -> list[tuple[Event, tuple[str, str]]]:
+    """Pair events with their normalized (home, away) fighter names.
+
+    Events without any fighter names are dropped.
+    """
+    prepared = []
+    for event in events:
+        home_name = event.home_team.name if event.home_team else ""
+        away_name = event.away_team.name if event.away_team else ""
+        if not home_name and not away_name:
+            continue
+        prepared.append(
+            (event, (_normalize_fighter_name(home_name), _normalize_fighter_name(away_name)))
+        )
+    return prepared
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EventMatchContext:
     """Context for event card matching."""
 
@@ -73,6 +111,12 @@ class EventCardMatcher:
         self._service = service
         self._cache = cache
 
+        # Per-league provider check and per-date event lists, reused across streams.
+        # Date events are dropped whenever the cache generation advances.
+        self._is_tsdb_league: dict[str, bool] = {}
+        self._date_events: dict[tuple[str, date, ZoneInfo], list[Event]] = {}
+        self._date_events_generation: int | None = None
+
     def match(
         self,
         classified: ClassifiedStream,
@@ -125,10 +169,8 @@ class EventCardMatcher:
             )
             return cache_result
 
-        # Get events for this league (TSDB leagues use cache-only)
-        is_tsdb = self._service.get_provider_name(league) == "tsdb"
-        events = self._service.get_events(league, target_date, cache_only=is_tsdb)
-        if not events:
+        date_events = self._get_date_events(league, target_date, generation, user_tz)
+        if date_events is None:
             return MatchOutcome.failed(
                 FailedReason.NO_EVENT_CARD_MATCH,
                 stream_name=ctx.stream_name,
@@ -136,9 +178,6 @@ class EventCardMatcher:
                 detail=f"No {league} events for {target_date}",
             )
 
-        # Filter to events on target date
-        date_events = [e for e in events if e.start_time.astimezone(user_tz).date() == target_date]
-
         if not date_events:
             return MatchOutcome.failed(
                 FailedReason.NO_EVENT_CARD_MATCH,
@@ -160,6 +199,41 @@ class EventCardMatcher:
     # PRIVATE METHODS
     # =========================================================================
 
+    def _get_date_events(
+        self,
+        league: str,
+        target_date: date,
+        generation: int,
+        user_tz: ZoneInfo,
+    ) -> list[Event] | None:
+        """Get a league's events on the target date, cached per generation.
+
+        Returns None if the provider has no events for the league at all.
+        """
+        if generation != self._date_events_generation:
+            self._date_events.clear()
+            self._date_events_generation = generation
+
+        key = (league, target_date, user_tz)
+        date_events = self._date_events.get(key)
+        if date_events is not None:
+            return date_events
+
+        # Get events for this league (TSDB leagues use cache-only)
+        is_tsdb = self._is_tsdb_league.get(league)
+        if is_tsdb is None:
+            is_tsdb = self._service.get_provider_name(league) == "tsdb"
+            self._is_tsdb_league[league] = is_tsdb
+        events = self._service.get_events(league, target_date, cache_only=is_tsdb)
+        if not events:
+            # Not cached - the provider may have events on a later stream
+            return None
+
+        # Filter to events on target date
+        date_events = [e for e in events if e.start_time.astimezone(user_tz).date() == target_date]
+        self._date_events[key] = date_events
+        return date_events
+
     def _check_cache(self, ctx: EventMatchContext) -> MatchOutcome | None:
         """Check cache for existing match."""
         entry = self._cache.get(ctx.group_id, ctx.stream_id, ctx.stream_name)
@@ -170,11 +244,7 @@ class EventCardMatcher:
         self._cache.touch(ctx.group_id, ctx.stream_id, ctx.stream_name, ctx.generation)
 
         # Reconstruct event
-        from teamarr.consumers.matching.team_matcher import TeamMatcher
-
-        # Reuse reconstruction logic (bit of a hack but avoids duplication)
-        matcher = TeamMatcher(self._service, self._cache)
-        event = matcher._reconstruct_event(entry.cached_data)
+        event = cache_data_to_event(entry.cached_data)
 
         if not event:
             self._cache.delete(ctx.group_id, ctx.stream_id, ctx.stream_name)
@@ -211,10 +281,7 @@ class EventCardMatcher:
             if event_num:
                 # Build regex pattern with word boundaries for precise matching
                 # e.g., "UFC 325" should match "UFC 325: Main Event" but not "UFC 3250"
-                pattern = re.compile(
-                    r"\b" + re.escape(event_num) + r"\b",
-                    re.IGNORECASE,
-                )
+                pattern = _event_number_pattern(event_num)
                 for event in events:
                     if pattern.search(event.name):
                         logger.debug(
@@ -245,32 +312,40 @@ class EventCardMatcher:
         extracted_fighter2 = ctx.classified.team2
 
         if extracted_fighter1 or extracted_fighter2:
-            # Use fuzzy matching (same approach as team_vs_team)
-            for event in events:
-                home_name = event.home_team.name if event.home_team else ""
-                away_name = event.away_team.name if event.away_team else ""
-
-                if not home_name and not away_name:
-                    continue
-
-                # Normalize names for comparison
-                home_norm = normalize_text(home_name)
-                away_norm = normalize_text(away_name)
+            # Normalize the stream's fighters once, not once per event
+            fighters = [
+                (fighter, normalize_text(fighter))
+                for fighter in (extracted_fighter1, extracted_fighter2)
+                if fighter
+            ]
 
+            # Use fuzzy matching (same approach as team_vs_team)
+            # Flat list of event fighter names: event i owns entries 2i (home), 2i+1 (away)
+            prepared = _prepare_fighter_names(events)
+            choices = [norm for _event, norms in prepared for norm in norms]
+
+            # One rapidfuzz scan per stream fighter finds the first event name at or
+            # above the threshold (extract_iter yields in choice order)
+            first_hit: int | None = None
+            for _fighter, fighter_norm in fighters:
+                for _choice, _score, index in process.extract_iter(
+                    fighter_norm,
+                    choices,
+                    scorer=fuzz.token_set_ratio,
+                    score_cutoff=FIGHTER_MATCH_THRESHOLD,
+                ):
+                    if first_hit is None or index < first_hit:
+                        first_hit = index
+                    break
+
+            if first_hit is not None:
+                event, event_fighter_norms = prepared[first_hit // 2]
                 best_score = 0
                 matched_fighter = None
 
-                # Score extracted fighters against event fighters
-                for fighter in [extracted_fighter1, extracted_fighter2]:
-                    if not fighter:
-                        continue
-                    fighter_norm = normalize_text(fighter)
-
-                    # Try against both event fighters
-                    for _event_fighter, event_fighter_norm in [
-                        (home_name, home_norm),
-                        (away_name, away_norm),
-                    ]:
+                # Score extracted fighters against the event's fighters
+                for fighter, fighter_norm in fighters:
+                    for event_fighter_norm in event_fighter_norms:
                         if not event_fighter_norm:
                             continue
                         score = fuzz.token_set_ratio(fighter_norm, event_fighter_norm)
@@ -324,20 +399,12 @@ class EventCardMatcher:
             return None
 
         # UFC 315, UFC FN 45
-        match = re.search(
-            r"(ufc\s*(?:fn|fight\s*night)?\s*\d+)",
-            hint,
-            re.IGNORECASE,
-        )
+        match = _UFC_EVENT_RE.search(hint)
         if match:
             return match.group(1).upper().replace("  ", " ")
 
         # PFL 5, Bellator 300
-        match = re.search(
-            r"((?:pfl|bellator|one\s*fc)\s*\d+)",
-            hint,
-            re.IGNORECASE,
-        )
+        match = _OTHER_EVENT_RE.search(hint)
         if match:
             return match.group(1).upper()
 
@@ -35,6 +35,7 @@ from teamarr.consumers.matching.classifier import (
 )
 from teamarr.consumers.matching.constants import MATCH_WINDOW_DAYS
 from teamarr.consumers.matching.event_matcher import EventCardMatcher
+from teamarr.consumers.matching.normalizer import NormalizedStream, normalize_streams
 from teamarr.consumers.matching.result import (
     ExcludedReason,
     FailedReason,
@@ -329,28 +330,38 @@ class StreamMatcher:
             include_leagues=list(self._include_leagues),
         )
 
-        total_streams = len(streams)
-        for idx, stream in enumerate(streams, 1):
-            stream_id = stream.get("id", 0)
-            stream_name = stream.get("name", "")
-
-            match_result = self._match_single(
-                stream_id=stream_id,
-                stream_name=stream_name,
-                target_date=target_date,
-            )
+        # Preload cache entries for all streams and buffer cache writes
+        self._cache.begin_batch(self._group_id, streams)
+        try:
+            total_streams = len(streams)
+            # Normalize the batch up front so repeated names are normalized once
+            normalized_streams = normalize_streams(stream.get("name", "") for stream in streams)
+            for idx, (stream, normalized) in enumerate(
+                zip(streams, normalized_streams, strict=True), 1
+            ):
+                stream_id = stream.get("id", 0)
+                stream_name = stream.get("name", "")
+
+                match_result = self._match_single(
+                    stream_id=stream_id,
+                    stream_name=stream_name,
+                    target_date=target_date,
+                    normalized=normalized,
+                )
 
-            # Track cache stats
-            if match_result.from_cache:
-                result.cache_hits += 1
-            else:
-                result.cache_misses += 1
+                # Track cache stats
+                if match_result.from_cache:
+                    result.cache_hits += 1
+                else:
+                    result.cache_misses += 1
 
-            result.results.append(match_result)
+                result.results.append(match_result)
 
-            # Report per-stream progress
-            if progress_callback:
-                progress_callback(idx, total_streams, stream_name, match_result.matched)
+                # Report per-stream progress
+                if progress_callback:
+                    progress_callback(idx, total_streams, stream_name, match_result.matched)
+        finally:
+            self._cache.end_batch()
 
         logger.info(
             "[COMPLETED] Stream matching: %d/%d matched (%d included), cache_hit_rate=%.1f%%",
@@ -469,13 +480,20 @@ class StreamMatcher:
         stream_id: int,
         stream_name: str,
         target_date: date,
+        normalized: NormalizedStream | None = None,
     ) -> MatchedStreamResult:
-        """Match a single stream."""
+        """Match a single stream.
+
+        normalized is the stream name's normalize_stream() result when the
+        caller already has it (match_all normalizes the whole batch).
+        """
         # Step 1: Classify the stream
         # Determine event type from configured leagues
         league_event_type = self._get_dominant_event_type()
 
-        classified = classify_stream(stream_name, league_event_type, self._custom_regex)
+        classified = classify_stream(
+            stream_name, league_event_type, self._custom_regex, normalized=normalized
+        )
 
         # Step 2: Handle placeholders (streams that couldn't be classified)
         # Note: Placeholder pattern detection and unsupported sports filtering
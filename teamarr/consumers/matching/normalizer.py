@@ -10,8 +10,10 @@ Cleans up heterogeneous, poorly-formatted stream names before matching:
 
 import logging
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date, time
+from time import monotonic
 
 from unidecode import unidecode
 
@@ -19,10 +21,21 @@ from teamarr.utilities.constants import BROADCAST_NETWORKS, CITY_TRANSLATIONS, P
 
 logger = logging.getLogger(__name__)
 
+# Try to import google-re2 for the ASCII datetime scans (linear-time DFA engine)
+try:
+    import re2
 
-@dataclass
+    ASCII_REGEX_MODULE = re2
+except ImportError:
+    ASCII_REGEX_MODULE = re
+
+
+@dataclass(frozen=True)
 class NormalizedStream:
-    """Result of stream normalization with extracted metadata."""
+    """Result of stream normalization with extracted metadata.
+
+    Frozen so results can be shared; use dataclasses.replace() to override fields.
+    """
 
     original: str
     normalized: str
@@ -35,6 +48,10 @@ class NormalizedStream:
     provider_prefix: str | None = None
 
 
+# Shared result for empty names, common in poorly-formed M3Us
+_EMPTY_NORMALIZED = NormalizedStream(original="", normalized="")
+
+
 # =============================================================================
 # MOJIBAKE DETECTION AND FIXING
 # =============================================================================
@@ -68,6 +85,10 @@ MOJIBAKE_PATTERNS = [
     (r"Ã»", "u"),
 ]
 
+# Every pattern starts with "Ã", so one alternation replaces them all in a single pass
+_MOJIBAKE_RE = re.compile("|".join(re.escape(pattern) for pattern, _ in MOJIBAKE_PATTERNS))
+_MOJIBAKE_MAP = dict(MOJIBAKE_PATTERNS)
+
 
 def fix_mojibake(text: str) -> str:
     """Fix common mojibake patterns from double-encoded UTF-8.
@@ -78,12 +99,11 @@ def fix_mojibake(text: str) -> str:
     Returns:
         Fixed text with proper unicode characters
     """
-    if not text:
+    # Fast path: all mojibake patterns contain "Ã"
+    if not text or "Ã" not in text:
         return text
 
-    result = text
-    for pattern, replacement in MOJIBAKE_PATTERNS:
-        result = result.replace(pattern, replacement)
+    result = _MOJIBAKE_RE.sub(lambda m: _MOJIBAKE_MAP[m.group(0)], text)
 
     if result != text:
         logger.debug("[MOJIBAKE] Fixed: '%s' -> '%s'", text[:40], result[:40])
@@ -96,9 +116,31 @@ def fix_mojibake(text: str) -> str:
 # =============================================================================
 
 
+def _build_prefix_trie(prefixes: list[str]) -> dict:
+    """Build a character trie of lowercased prefixes.
+
+    Terminal nodes store (list index, original prefix) under the None key so
+    a walk can honor list order when several prefixes match.
+    """
+    trie: dict = {}
+    for index, prefix in enumerate(prefixes):
+        node = trie
+        for ch in prefix.lower():
+            node = node.setdefault(ch, {})
+        node.setdefault(None, (index, prefix))
+    return trie
+
+
+_PROVIDER_PREFIX_TRIE = _build_prefix_trie(PROVIDER_PREFIXES)
+_PROVIDER_PREFIX_MAX_LEN = max(len(p) for p in PROVIDER_PREFIXES)
+
+
 def strip_provider_prefix(text: str) -> tuple[str, str | None]:
     """Remove provider prefix from stream name.
 
+    Walks the prefix trie from the start of the name, so names that don't
+    begin with a known provider exit after the first character or two.
+
     Args:
         text: Stream name potentially with provider prefix
 
@@ -108,13 +150,22 @@ def strip_provider_prefix(text: str) -> tuple[str, str | None]:
     if not text:
         return text, None
 
-    text_lower = text.lower()
+    node = _PROVIDER_PREFIX_TRIE
+    best: tuple[int, str] | None = None
+    for ch in text[:_PROVIDER_PREFIX_MAX_LEN].lower():
+        node = node.get(ch)
+        if node is None:
+            break
+        terminal = node.get(None)
+        # First match in PROVIDER_PREFIXES order wins, as with a linear scan
+        if terminal and (best is None or terminal[0] < best[0]):
+            best = terminal
 
-    for prefix in PROVIDER_PREFIXES:
-        if text_lower.startswith(prefix.lower()):
-            return text[len(prefix) :].strip(), prefix.strip()
+    if best is None:
+        return text, None
 
-    return text, None
+    prefix = best[1]
+    return text[len(prefix) :].strip(), prefix.strip()
 
 
 # =============================================================================
@@ -122,6 +173,12 @@ def strip_provider_prefix(text: str) -> tuple[str, str | None]:
 # =============================================================================
 
 
+# Longest variant first so the alternation never stops at a shorter overlap
+_CITY_ITEMS = sorted(CITY_TRANSLATIONS.items(), key=lambda item: len(item[0]), reverse=True)
+_CITY_RE = re.compile("|".join(re.escape(variant) for variant, _ in _CITY_ITEMS), re.IGNORECASE)
+_CITY_MAP = {variant.lower(): english for variant, english in _CITY_ITEMS}
+
+
 def apply_city_translations(text: str) -> str:
     """Apply city name translations.
 
@@ -137,22 +194,13 @@ def apply_city_translations(text: str) -> str:
     if not text:
         return text
 
-    # First pass: unidecode to normalize accents
+    # First pass: unidecode to normalize accents (skipped for plain ASCII)
     # This converts München → Munchen
-    text = unidecode(text)
-
-    # Second pass: apply manual translations
-    # Work on lowercased version for matching, preserve original case pattern
-    result = text
-    text_lower = text.lower()
+    if not text.isascii():
+        text = unidecode(text)
 
-    for variant, english in CITY_TRANSLATIONS.items():
-        if variant in text_lower:
-            # Find the position and replace preserving some case
-            pattern = re.compile(re.escape(variant), re.IGNORECASE)
-            result = pattern.sub(english, result)
-
-    return result
+    # Second pass: apply manual translations in one case-insensitive scan
+    return _CITY_RE.sub(lambda m: _CITY_MAP[m.group(0).lower()], text)
 
 
 # =============================================================================
@@ -196,8 +244,132 @@ TIME_PATTERNS = [
     (rf"\b(\d{{1,2}})\s*(AM|PM|am|pm)\s*({_TZ_ABBREVS})?\b", "TIME_MASK"),
 ]
 
-# Standalone TZ pattern (after time has been masked, e.g., "@ ET" at end)
-TZ_STANDALONE_PATTERN = rf"\s*@?\s*({_TZ_ABBREVS})\s*$"
+# Standalone TZ pattern (after time has been masked, e.g., "@ ET" at end).
+# \b keeps it to a whole word, so "Forest" or "Santa Cruz" aren't read as EST/Z
+TZ_STANDALONE_PATTERN = rf"\s*@?\s*\b({_TZ_ABBREVS})\s*$"
+
+# Literal hints: a pattern can only match if the lowercased text contains one
+# of its hints, so the regex is skipped when none is present
+_MONTH_HINTS = tuple(_MONTHS.lower().split("|"))
+_DATE_SEPARATOR_HINTS = ("/", "-")
+_TIME_PATTERN_HINTS = [(":",), ("am", "pm")]
+
+
+def compile_case_variants(pattern: str) -> tuple[re.Pattern, re.Pattern]:
+    """Compile a pattern for lowercased ASCII text plus an IGNORECASE fallback.
+
+    Matching pre-lowercased text case-sensitively keeps re's literal
+    optimizations that IGNORECASE disables. Lowercasing the source is only
+    safe without uppercase escapes (\\D, \\S, \\W, \\B), so those are rejected.
+    """
+    if re.search(r"\\[A-Z]", pattern):
+        raise ValueError(f"Uppercase escape in datetime pattern: {pattern}")
+    return _compile_ascii(pattern.lower()), re.compile(pattern, re.IGNORECASE)
+
+
+# Python's \s on ASCII text; RE2's \s omits \v and \x1c-\x1f
+_ASCII_SPACE_CLASS = r"[\t\n\v\f\r \x1c-\x1f]"
+
+
+def _compile_ascii(pattern: str) -> re.Pattern:
+    """Compile a pattern that only ever sees ASCII text, with RE2 when installed.
+
+    On ASCII input RE2's \\d and \\b agree with re's. Patterns RE2 can't
+    compile (e.g. the (?!:) lookahead) fall back to re.
+    """
+    if ASCII_REGEX_MODULE is not re:
+        try:
+            return ASCII_REGEX_MODULE.compile(pattern.replace(r"\s", _ASCII_SPACE_CLASS))
+        except ASCII_REGEX_MODULE.error:
+            pass
+    return re.compile(pattern)
+
+
+_MONTH_NUMBERS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+
+# One parser per DATE_PATTERNS entry, reading that pattern's groups directly.
+# Invalid dates (e.g. 02/30/2025) parse to None.
+
+
+def _parse_iso_date(match: re.Match) -> date | None:
+    """Parse YYYY-MM-DD."""
+    try:
+        return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
+
+
+def _parse_us_date(match: re.Match) -> date | None:
+    """Parse MM/DD/YY or MM/DD/YYYY."""
+    year = int(match.group(3))
+    # Handle 2-digit year
+    if year < 100:
+        year += 2000 if year < 50 else 1900
+    try:
+        return date(year, int(match.group(1)), int(match.group(2)))
+    except ValueError:
+        return None
+
+
+def _parse_no_year_date(match: re.Match) -> date | None:
+    """Parse MM/DD, inferring the year from proximity to today."""
+    return _infer_year_for_date(int(match.group(1)), int(match.group(2)))
+
+
+def _parse_month_name_date(month_name: str, day: str) -> date | None:
+    month = _MONTH_NUMBERS.get(month_name.lower())
+    return _infer_year_for_date(month, int(day)) if month else None
+
+
+def _parse_day_month_date(match: re.Match) -> date | None:
+    """Parse "31 Dec" / "14th January"."""
+    return _parse_month_name_date(match.group(2), match.group(1))
+
+
+def _parse_month_day_date(match: re.Match) -> date | None:
+    """Parse "Dec 31" / "January 14th"."""
+    return _parse_month_name_date(match.group(1), match.group(2))
+
+
+_DATE_PATTERN_PARSERS = [
+    _parse_iso_date,
+    _parse_us_date,
+    _parse_no_year_date,
+    _parse_day_month_date,
+    _parse_month_day_date,
+]
+
+
+# Compiled once at import; these run for every stream in the sweep
+_DATE_PATTERNS_RE = [
+    (
+        *compile_case_variants(pattern),
+        parser,
+        _MONTH_HINTS if _MONTHS in pattern else _DATE_SEPARATOR_HINTS,
+    )
+    for (pattern, _mask), parser in zip(DATE_PATTERNS, _DATE_PATTERN_PARSERS, strict=True)
+]
+# Time entries carry the space-padded mask, spliced in as-is
+_TIME_PATTERNS_RE = [
+    (*compile_case_variants(pattern), f" {mask} ", hints)
+    for (pattern, mask), hints in zip(TIME_PATTERNS, _TIME_PATTERN_HINTS, strict=True)
+]
+_TZ_STANDALONE_RE = re.compile(TZ_STANDALONE_PATTERN, re.IGNORECASE)
+_DIGIT_RE = re.compile(r"\d")
 
 # Map timezone abbreviations to IANA timezone names
 TZ_ABBREVIATION_MAP = {
@@ -319,32 +491,56 @@ def extract_and_mask_datetime(text: str) -> tuple[str, date | None, time | None,
     extracted_time = None
     extracted_tz = None
 
-    # Extract and mask dates
-    for pattern, mask in DATE_PATTERNS:
-        match = re.search(pattern, result, re.IGNORECASE)
-        if match:
-            is_iso = mask == "DATE_MASK_ISO"
-            no_year = mask == "DATE_MASK_NO_YEAR"
-            extracted_date = _parse_date_match(match, is_iso=is_iso, no_year=no_year)
-            result = re.sub(pattern, " DATE_MASK ", result, count=1, flags=re.IGNORECASE)
-            break
-
-    # Extract and mask times (with optional TZ)
-    for pattern, mask in TIME_PATTERNS:
-        match = re.search(pattern, result, re.IGNORECASE)
-        if match:
-            extracted_time, extracted_tz = _parse_time_match(match)
-            result = re.sub(pattern, f" {mask} ", result, count=1, flags=re.IGNORECASE)
-            break
-
-    # If no TZ from time, check for standalone TZ (e.g., "@ ET" at end)
+    # Every date and time pattern needs a digit; most stream names have none.
+    # Patterns stay separate searches because list order sets their priority.
+    if _DIGIT_RE.search(result):
+        # ASCII text is matched lowercased with the case-sensitive variants;
+        # lowering keeps its length, so match spans apply to result as-is
+        is_ascii = result.isascii()
+
+        # Extract and mask dates
+        lowered = result.lower()
+        for ascii_pattern, pattern, parse_date, hints in _DATE_PATTERNS_RE:
+            if not any(hint in lowered for hint in hints):
+                continue
+            match = ascii_pattern.search(lowered) if is_ascii else pattern.search(result)
+            if match:
+                extracted_date = parse_date(match)
+                start, end = match.span()
+                result = f"{result[:start]} DATE_MASK {result[end:]}"
+                # Splice the lowered copy too; non-ASCII lowering may change
+                # length, so that text is lowered again instead
+                if is_ascii:
+                    lowered = f"{lowered[:start]} date_mask {lowered[end:]}"
+                else:
+                    lowered = result.lower()
+                break
+
+        # Extract and mask times (with optional TZ)
+        for ascii_pattern, pattern, replacement, hints in _TIME_PATTERNS_RE:
+            if not any(hint in lowered for hint in hints):
+                continue
+            match = ascii_pattern.search(lowered) if is_ascii else pattern.search(result)
+            if match:
+                extracted_time, extracted_tz = _parse_time_match(match)
+                result = result[: match.start()] + replacement + result[match.end() :]
+                break
+
+    # If no TZ from time, check for standalone TZ (e.g., "@ ET" at end).
+    # A match is end-anchored and whole-word, so the abbreviation is the last
+    # token; checking that token first avoids scanning from every position.
     if not extracted_tz:
-        tz_match = re.search(TZ_STANDALONE_PATTERN, result, re.IGNORECASE)
+        tokens = result.rsplit(None, 1)
+        tz_match = (
+            _TZ_STANDALONE_RE.search(result)
+            if tokens and _TZ_STANDALONE_RE.search(tokens[-1])
+            else None
+        )
         if tz_match:
             tz_abbrev = tz_match.group(1).upper()
             extracted_tz = TZ_ABBREVIATION_MAP.get(tz_abbrev)
-            # Remove the standalone TZ from result
-            result = re.sub(TZ_STANDALONE_PATTERN, "", result, flags=re.IGNORECASE)
+            # Remove the standalone TZ from result (end-anchored, so this is the only match)
+            result = result[: tz_match.start()] + result[tz_match.end() :]
 
     # Clean up multiple spaces
     result = " ".join(result.split())
@@ -352,72 +548,21 @@ def extract_and_mask_datetime(text: str) -> tuple[str, date | None, time | None,
     return result, extracted_date, extracted_time, extracted_tz
 
 
-def _parse_date_match(match: re.Match, is_iso: bool = False, no_year: bool = False) -> date | None:
-    """Parse a date from regex match.
-
-    Args:
-        match: Regex match object
-        is_iso: True if pattern matched ISO format (YYYY-MM-DD)
-        no_year: True if pattern matched MM/DD without year (infer year)
-    """
-    try:
-        groups = match.groups()
-        text = match.group(0)
-
-        # Check if it's a month name pattern
-        month_names = {
-            "jan": 1,
-            "feb": 2,
-            "mar": 3,
-            "apr": 4,
-            "may": 5,
-            "jun": 6,
-            "jul": 7,
-            "aug": 8,
-            "sep": 9,
-            "oct": 10,
-            "nov": 11,
-            "dec": 12,
-        }
-
-        for month_abbr, month_num in month_names.items():
-            if month_abbr in text.lower():
-                # Extract day number
-                day_match = re.search(r"(\d{1,2})", text)
-                if day_match:
-                    day = int(day_match.group(1))
-                    return _infer_year_for_date(month_num, day)
-                return None
-
-        # MM/DD without year - infer year based on proximity to today
-        if no_year and len(groups) >= 2:
-            month = int(groups[0])
-            day = int(groups[1])
-            return _infer_year_for_date(month, day)
-
-        # Numeric date patterns with year
-        if len(groups) >= 3:
-            if is_iso:
-                # ISO format: YYYY-MM-DD
-                year = int(groups[0])
-                month = int(groups[1])
-                day = int(groups[2])
-            else:
-                # US format: MM/DD/YY or MM/DD/YYYY
-                month = int(groups[0])
-                day = int(groups[1])
-                year = int(groups[2])
-
-                # Handle 2-digit year
-                if year < 100:
-                    year += 2000 if year < 50 else 1900
-
-            return date(year, month, day)
+# Today's date, re-read from the clock at most once per TTL; a minute of
+# staleness is irrelevant to the +/- 6 month year inference
+_TODAY_TTL_SECONDS = 60.0
+_today_cache: tuple[float, date] = (0.0, date.min)
 
-    except (ValueError, IndexError, TypeError):
-        pass
 
-    return None
+def _today() -> date:
+    """Get today's local date, cached for _TODAY_TTL_SECONDS."""
+    global _today_cache
+    expires_at, today = _today_cache
+    now = monotonic()
+    if now >= expires_at:
+        today = date.today()
+        _today_cache = (now + _TODAY_TTL_SECONDS, today)
+    return today
 
 
 def _infer_year_for_date(month: int, day: int) -> date | None:
@@ -426,9 +571,7 @@ def _infer_year_for_date(month: int, day: int) -> date | None:
     For sports streams, prefer dates in the near future over past.
     If the date in current year is more than 6 months ago, assume next year.
     """
-    from datetime import datetime
-
-    today = datetime.now().date()
+    today = _today()
     current_year = today.year
 
     try:
@@ -465,17 +608,9 @@ def _parse_time_match(match: re.Match) -> tuple[time | None, str | None]:
         if len(groups) > 1 and groups[1] and groups[1].isdigit():
             minute = int(groups[1])
 
-        # Check for AM/PM and TZ
-        am_pm = None
-        tz_abbrev = None
-        for g in groups:
-            if not g:
-                continue
-            g_upper = g.upper()
-            if g_upper in ("AM", "PM"):
-                am_pm = g_upper
-            elif g_upper in TZ_ABBREVIATION_MAP:
-                tz_abbrev = g_upper
+        # Every TIME_PATTERNS entry ends with (AM/PM)?, (TZ)? groups
+        am_pm = groups[-2].upper() if groups[-2] else None
+        tz_abbrev = groups[-1]
 
         # Convert to 24-hour
         if am_pm == "PM" and hour < 12:
@@ -484,7 +619,7 @@ def _parse_time_match(match: re.Match) -> tuple[time | None, str | None]:
             hour = 0
 
         # Convert TZ abbreviation to IANA name
-        tz_iana = TZ_ABBREVIATION_MAP.get(tz_abbrev) if tz_abbrev else None
+        tz_iana = TZ_ABBREVIATION_MAP.get(tz_abbrev.upper()) if tz_abbrev else None
 
         return time(hour, minute), tz_iana
 
@@ -499,6 +634,21 @@ def _parse_time_match(match: re.Match) -> tuple[time | None, str | None]:
 # =============================================================================
 
 
+_NEWLINES_RE = re.compile(r"[\r\n]+")
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+# str.translate equivalent of _PUNCTUATION_RE for ASCII text (the usual case
+# after unidecode): every ASCII char that is neither \w nor \s maps to a space
+_ASCII_PUNCTUATION_TABLE = {
+    code: " " for code in range(128) if _PUNCTUATION_RE.fullmatch(chr(code))
+}
+
+# All network names in one alternation, kept in list order so the same name
+# wins at a given position as with the old one-pass-per-network loop
+_BROADCAST_NETWORK_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(network.lower()) for network in BROADCAST_NETWORKS) + r")\b"
+)
+
+
 def normalize_stream(stream_name: str) -> NormalizedStream:
     """Full normalization pipeline for stream names.
 
@@ -506,8 +656,7 @@ def normalize_stream(stream_name: str) -> NormalizedStream:
     1. Fix mojibake (double-encoded UTF-8)
     2. Strip provider prefix
     3. Apply city translations (with unidecode)
-    4. Extract and mask datetime
-    5. Clean whitespace
+    4. Extract and mask datetime (also collapses whitespace)
 
     Args:
         stream_name: Raw stream name from M3U
@@ -516,15 +665,12 @@ def normalize_stream(stream_name: str) -> NormalizedStream:
         NormalizedStream with cleaned text and extracted metadata
     """
     if not stream_name:
-        return NormalizedStream(
-            original=stream_name or "",
-            normalized="",
-        )
+        return _EMPTY_NORMALIZED
 
     original = stream_name
 
     # Step 0: Normalize newlines to spaces (some streams have literal newlines)
-    text = re.sub(r"[\r\n]+", " ", stream_name)
+    text = _NEWLINES_RE.sub(" ", stream_name)
 
     # Step 1: Fix mojibake
     text = fix_mojibake(text)
@@ -536,21 +682,20 @@ def normalize_stream(stream_name: str) -> NormalizedStream:
     text = apply_city_translations(text)
 
     # Step 4: Extract and mask datetime (including timezone)
+    # Its whitespace cleanup is the pipeline's final pass
     text, extracted_date, extracted_time, extracted_tz = extract_and_mask_datetime(text)
 
-    # Step 5: Clean whitespace and normalize
-    text = " ".join(text.split())
-    text = text.strip()
-
-    logger.debug(
-        "[NORMALIZE] '%s' -> '%s' (date=%s, time=%s, tz=%s, prefix=%s)",
-        original[:60],
-        text[:60],
-        extracted_date,
-        extracted_time,
-        extracted_tz,
-        provider_prefix,
-    )
+    # Guarded: the [:60] slices are evaluated even when debug is off
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[NORMALIZE] '%s' -> '%s' (date=%s, time=%s, tz=%s, prefix=%s)",
+            original[:60],
+            text[:60],
+            extracted_date,
+            extracted_time,
+            extracted_tz,
+            provider_prefix,
+        )
 
     return NormalizedStream(
         original=original,
@@ -562,6 +707,29 @@ def normalize_stream(stream_name: str) -> NormalizedStream:
     )
 
 
+def normalize_streams(stream_names: Iterable[str]) -> list[NormalizedStream]:
+    """Normalize a batch of stream names.
+
+    M3U sources often repeat names (backup feeds, duplicate groups), so each
+    distinct name goes through the pipeline once and repeats share its
+    (frozen) result.
+
+    Args:
+        stream_names: Raw stream names from M3U
+
+    Returns:
+        NormalizedStream per input name, in order
+    """
+    seen: dict[str, NormalizedStream] = {}
+    results: list[NormalizedStream] = []
+    for stream_name in stream_names:
+        normalized = seen.get(stream_name)
+        if normalized is None:
+            normalized = seen[stream_name] = normalize_stream(stream_name)
+        results.append(normalized)
+    return results
+
+
 def normalize_for_matching(text: str) -> str:
     """Quick normalization for matching (no metadata extraction).
 
@@ -586,13 +754,13 @@ def normalize_for_matching(text: str) -> str:
 
     # Remove broadcast network names (ESPN, FOX, etc.) that add noise
     # These appear in streams like "MIL Bucks ( ESPN Feed )"
-    for network in BROADCAST_NETWORKS:
-        text = re.sub(rf"\b{re.escape(network.lower())}\b", " ", text)
+    text = _BROADCAST_NETWORK_RE.sub(" ", text)
 
     # Remove punctuation except spaces (hyphens become spaces for matching)
-    text = re.sub(r"[^\w\s]", " ", text)
-
-    # Normalize whitespace
-    text = " ".join(text.split())
+    if text.isascii():
+        text = text.translate(_ASCII_PUNCTUATION_TABLE)
+    else:
+        text = _PUNCTUATION_RE.sub(" ", text)
 
-    return text.strip()
+    # Normalize whitespace (split/join also trims both ends)
+    return " ".join(text.split())
@@ -10,6 +10,7 @@ import logging
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -28,8 +29,12 @@ from teamarr.consumers.matching.result import (
     MatchMethod,
     MatchOutcome,
 )
-from teamarr.consumers.stream_match_cache import StreamMatchCache, event_to_cache_data
-from teamarr.core.types import Event, Team
+from teamarr.consumers.stream_match_cache import (
+    StreamMatchCache,
+    cache_data_to_event,
+    event_to_cache_data,
+)
+from teamarr.core.types import Event
 from teamarr.services.sports_data import SportsDataService
 from teamarr.utilities.constants import TEAM_ALIASES
 from teamarr.utilities.fuzzy_match import get_matcher, normalize_text
@@ -40,6 +45,16 @@ logger = logging.getLogger(__name__)
 UserAliasCache = dict[tuple[str, str], str]
 
 
+@lru_cache(maxsize=8192)
+def _local_date(start_time: datetime, tz: ZoneInfo) -> date:
+    """Calendar date of an event start in a timezone.
+
+    Events are shared by every stream in a matching run, so the conversion is
+    cached instead of repeated per stream.
+    """
+    return start_time.astimezone(tz).date()
+
+
 @dataclass
 class MatchContext:
     """Context for a matching attempt."""
@@ -69,8 +84,7 @@ class MatchContext:
 
         Final/completed status is NOT checked here - lifecycle handles exclusions.
         """
-        event_start = event.start_time.astimezone(self.user_tz)
-        event_date = event_start.date()
+        event_date = _local_date(event.start_time, self.user_tz)
 
         earliest_date = self.target_date - timedelta(days=MATCH_WINDOW_DAYS)
 
@@ -374,7 +388,7 @@ class TeamMatcher:
         self._cache.touch(ctx.group_id, ctx.stream_id, ctx.stream_name, ctx.generation)
 
         # Reconstruct event from cached data
-        event = self._reconstruct_event(entry.cached_data)
+        event = cache_data_to_event(entry.cached_data)
         if not event:
             # Cache entry is invalid
             logger.debug(
@@ -475,14 +489,15 @@ class TeamMatcher:
             if not ctx.is_event_in_search_window(event):
                 continue
 
-            event_date = event.start_time.astimezone(ctx.user_tz).date()
+            # Cached by _local_date, so this reuses the window check's conversion
+            event_date = _local_date(event.start_time, ctx.user_tz)
 
             # Check for date mismatch from stream (if extracted)
             # Use stream_tz if available - the date in the stream name is in the provider's timezone
             if ctx.classified.normalized.extracted_date:
                 # Get event date in the stream's timezone (or user_tz as fallback)
                 compare_tz = ctx.stream_tz or ctx.user_tz
-                event_date_in_stream_tz = event.start_time.astimezone(compare_tz).date()
+                event_date_in_stream_tz = _local_date(event.start_time, compare_tz)
                 if ctx.classified.normalized.extracted_date != event_date_in_stream_tz:
                     continue
 
@@ -515,7 +530,7 @@ class TeamMatcher:
                 time_distance = 999999
                 if ctx.classified.normalized.extracted_time:
                     time_tz = ctx.stream_tz or ctx.user_tz
-                    ref_date = event.start_time.astimezone(time_tz).date()
+                    ref_date = _local_date(event.start_time, time_tz)
                     stream_dt = datetime.combine(
                         ref_date, ctx.classified.normalized.extracted_time, tzinfo=time_tz
                     )
@@ -628,14 +643,15 @@ class TeamMatcher:
             if not ctx.is_event_in_search_window(event):
                 continue
 
-            event_date = event.start_time.astimezone(ctx.user_tz).date()
+            # Cached by _local_date, so this reuses the window check's conversion
+            event_date = _local_date(event.start_time, ctx.user_tz)
 
             # Check for date mismatch from stream (if extracted)
             # Use stream_tz if available - the date in the stream name is in the provider's timezone
             if ctx.classified.normalized.extracted_date:
                 # Get event date in the stream's timezone (or user_tz as fallback)
                 compare_tz = ctx.stream_tz or ctx.user_tz
-                event_date_in_stream_tz = event.start_time.astimezone(compare_tz).date()
+                event_date_in_stream_tz = _local_date(event.start_time, compare_tz)
                 if ctx.classified.normalized.extracted_date != event_date_in_stream_tz:
                     continue
 
@@ -668,7 +684,7 @@ class TeamMatcher:
                 time_distance = 999999
                 if ctx.classified.normalized.extracted_time:
                     time_tz = ctx.stream_tz or ctx.user_tz
-                    ref_date = event.start_time.astimezone(time_tz).date()
+                    ref_date = _local_date(event.start_time, time_tz)
                     stream_dt = datetime.combine(
                         ref_date, ctx.classified.normalized.extracted_time, tzinfo=time_tz
                     )
@@ -1193,110 +1209,3 @@ class TeamMatcher:
             generation=ctx.generation,
             match_method=match_method_value,
         )
-
-    def _reconstruct_event(self, cached_data: dict[str, Any]) -> Event | None:
-        """Reconstruct Event from cached dict."""
-        try:
-            # Handle datetime parsing
-            start_time = cached_data.get("start_time")
-            if isinstance(start_time, str):
-                start_time = datetime.fromisoformat(start_time)
-
-            # Reconstruct teams (use `or {}` to handle explicit None values)
-            home_data = cached_data.get("home_team") or {}
-            away_data = cached_data.get("away_team") or {}
-
-            home_team = Team(
-                id=home_data.get("id", ""),
-                provider=home_data.get("provider", ""),
-                name=home_data.get("name", ""),
-                short_name=home_data.get("short_name", ""),
-                abbreviation=home_data.get("abbreviation", ""),
-                league=home_data.get("league", ""),
-                sport=home_data.get("sport", ""),
-                logo_url=home_data.get("logo_url"),
-                color=home_data.get("color"),
-            )
-
-            away_team = Team(
-                id=away_data.get("id", ""),
-                provider=away_data.get("provider", ""),
-                name=away_data.get("name", ""),
-                short_name=away_data.get("short_name", ""),
-                abbreviation=away_data.get("abbreviation", ""),
-                league=away_data.get("league", ""),
-                sport=away_data.get("sport", ""),
-                logo_url=away_data.get("logo_url"),
-                color=away_data.get("color"),
-            )
-
-            from teamarr.core.types import EventStatus
-
-            status_data = cached_data.get("status") or {}
-            status = EventStatus(
-                state=status_data.get("state", "scheduled"),
-                detail=status_data.get("detail"),
-                period=status_data.get("period"),
-                clock=status_data.get("clock"),
-            )
-
-            # Handle broadcast/broadcasts field compatibility
-            broadcast_val = cached_data.get("broadcasts") or cached_data.get("broadcast")
-            broadcasts = (
-                broadcast_val
-                if isinstance(broadcast_val, list)
-                else [broadcast_val]
-                if broadcast_val
-                else []
-            )
-
-            # Reconstruct Venue from dict if present
-            from teamarr.core.types import Venue
-
-            venue_data = cached_data.get("venue")
-            venue = None
-            if venue_data:
-                if isinstance(venue_data, dict):
-                    venue = Venue(
-                        name=venue_data.get("name", ""),
-                        city=venue_data.get("city"),
-                        state=venue_data.get("state"),
-                        country=venue_data.get("country"),
-                    )
-                else:
-                    venue = venue_data  # Already a Venue
-
-            # Reconstruct segment_times for UFC events
-            # Use `or {}` to handle both missing key AND explicit None value
-            segment_times_data = cached_data.get("segment_times") or {}
-            segment_times = {}
-            for seg_name, seg_time in segment_times_data.items():
-                if isinstance(seg_time, str):
-                    segment_times[seg_name] = datetime.fromisoformat(seg_time)
-                elif seg_time is not None:
-                    segment_times[seg_name] = seg_time
-
-            # Parse main_card_start if present
-            main_card_start = cached_data.get("main_card_start")
-            if isinstance(main_card_start, str):
-                main_card_start = datetime.fromisoformat(main_card_start)
-
-            return Event(
-                id=cached_data.get("id", ""),
-                provider=cached_data.get("provider", ""),
-                name=cached_data.get("name", ""),
-                short_name=cached_data.get("short_name"),
-                start_time=start_time,
-                home_team=home_team,
-                away_team=away_team,
-                status=status,
-                league=cached_data.get("league", ""),
-                sport=cached_data.get("sport", ""),
-                venue=venue,
-                broadcasts=broadcasts,
-                segment_times=segment_times,
-                main_card_start=main_card_start,
-            )
-        except Exception as e:
-            logger.warning("[MATCH_CACHE] Failed to reconstruct event from cache: %s", e)
-            return None
@@ -12,12 +12,17 @@ Integrates with FastAPI lifespan for clean startup/shutdown.
 
 import logging
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
 from croniter import croniter
 
+from teamarr.consumers.generation import run_full_generation
+from teamarr.database.settings import get_epg_settings, get_scheduler_settings
+from teamarr.dispatcharr import ChannelManager, get_dispatcharr_client, get_dispatcharr_connection
+from teamarr.services import create_cache_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -163,20 +168,22 @@ class CronScheduler:
 
         while not self._stop_event.is_set():
             # Calculate next run time
-            cron = croniter(self._cron_expression, datetime.now())
+            now = datetime.now()
+            cron = croniter(self._cron_expression, now)
             self._next_run = cron.get_next(datetime)
 
-            wait_seconds = (self._next_run - datetime.now()).total_seconds()
+            wait_seconds = (self._next_run - now).total_seconds()
             logger.debug(
                 "[CRON] Next run: %s (%.0fs)",
                 self._next_run.strftime("%Y-%m-%d %H:%M:%S"),
                 wait_seconds,
             )
 
-            # Wait until next run time (checking stop event every second)
-            while wait_seconds > 0 and not self._stop_event.is_set():
-                sleep_time = min(1.0, wait_seconds)
-                time.sleep(sleep_time)
+            # Wait until next run time; stop() wakes the wait immediately.
+            # Re-check the wall clock after waking in case it was adjusted.
+            while wait_seconds > 0:
+                if self._stop_event.wait(wait_seconds):
+                    return
                 wait_seconds = (self._next_run - datetime.now()).total_seconds()
 
             if self._stop_event.is_set():
@@ -202,24 +209,30 @@ class CronScheduler:
         Returns:
             Dict with task results
         """
-        self._last_run = datetime.now()
+        started_at = datetime.now()
+        self._last_run = started_at
         results = {
-            "started_at": self._last_run.isoformat(),
+            "started_at": started_at.isoformat(),
             "channel_reset": {},
             "cache_refresh": {},
             "epg_generation": {},
         }
 
-        # Scheduled channel reset (runs before EPG generation if due)
+        # Scheduled channel reset (if due) and daily cache refresh (if > 1 day
+        # old) are independent - Dispatcharr vs provider APIs - so run them
+        # concurrently; both must finish before EPG generation
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="cron-task") as executor:
+            reset_future = executor.submit(self._task_channel_reset)
+            refresh_future = executor.submit(self._task_refresh_cache)
+
         try:
-            results["channel_reset"] = self._task_channel_reset()
+            results["channel_reset"] = reset_future.result()
         except Exception as e:
             logger.warning("[CRON] Channel reset task failed: %s", e)
             results["channel_reset"] = {"error": str(e)}
 
-        # Daily cache refresh (only refreshes if > 1 day old)
         try:
-            results["cache_refresh"] = self._task_refresh_cache()
+            results["cache_refresh"] = refresh_future.result()
         except Exception as e:
             logger.warning("[CRON] Cache refresh task failed: %s", e)
             results["cache_refresh"] = {"error": str(e)}
@@ -248,8 +261,6 @@ class CronScheduler:
         Returns:
             Dict with reset status
         """
-        from teamarr.database.settings import get_scheduler_settings
-
         with self._db_factory() as conn:
             settings = get_scheduler_settings(conn)
 
@@ -262,11 +273,12 @@ class CronScheduler:
         # Check if reset cron has fired since last scheduler run
         # We use a 1-hour window to catch the reset even if scheduler timing drifts
         try:
-            reset_cron = croniter(settings.channel_reset_cron, datetime.now())
+            now = datetime.now()
+            reset_cron = croniter(settings.channel_reset_cron, now)
             last_reset_time = reset_cron.get_prev(datetime)
 
             # If last reset time was within the last hour, run the reset
-            time_since_reset = (datetime.now() - last_reset_time).total_seconds()
+            time_since_reset = (now - last_reset_time).total_seconds()
             if time_since_reset > 3600:  # More than 1 hour ago
                 return {
                     "skipped": True,
@@ -280,8 +292,6 @@ class CronScheduler:
         # Perform the reset
         logger.info("[CRON] Running scheduled channel reset")
 
-        from teamarr.dispatcharr import ChannelManager, get_dispatcharr_client
-
         client = get_dispatcharr_client(self._db_factory)
         if not client:
             return {"skipped": True, "reason": "Dispatcharr not connected"}
@@ -332,8 +342,6 @@ class CronScheduler:
         Returns:
             Dict with refresh status
         """
-        from teamarr.services import create_cache_service
-
         cache_service = create_cache_service(self._db_factory)
         refreshed = cache_service.refresh_if_needed(max_age_days=1)
 
@@ -372,7 +380,6 @@ class CronScheduler:
             start_generation,
             update_status,
         )
-        from teamarr.consumers.generation import run_full_generation
 
         # Mark generation as started (enables UI polling)
         if not start_generation():
@@ -400,8 +407,6 @@ class CronScheduler:
 
         # Get fresh Dispatcharr connection from factory
         # (stored reference may be stale if settings were updated)
-        from teamarr.dispatcharr import get_dispatcharr_connection
-
         dispatcharr_client = get_dispatcharr_connection(self._db_factory)
 
         # Run the unified generation with progress tracking
@@ -476,8 +481,6 @@ def start_lifecycle_scheduler(
     """
     global _scheduler
 
-    from teamarr.database.settings import get_epg_settings, get_scheduler_settings
-
     # Get settings
     with db_factory() as conn:
         scheduler_settings = get_scheduler_settings(conn)
@@ -19,6 +19,13 @@ Usage:
         event = match_stream(stream_name)
         # Cache the result
         cache.set(group_id, stream_id, stream_name, event.id, league, event_data)
+
+    # Matching a whole group: one preload query, buffered touch/set writes
+    cache.begin_batch(group_id, streams)
+    try:
+        ...  # get()/touch()/set() per stream as above
+    finally:
+        cache.end_batch()
 """
 
 import hashlib
@@ -26,14 +33,47 @@ import json
 import logging
 import sqlite3
 from collections.abc import Callable
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any
 
 from teamarr.core import Event
+from teamarr.core.types import EventStatus, Team, Venue
 
 logger = logging.getLogger(__name__)
 
+_SELECT_ENTRY_COLUMNS = (
+    "fingerprint, event_id, league, cached_event_data, match_method, user_corrected, "
+    "last_seen_generation"
+)
+
+_UPSERT_MATCH_SQL = """
+    INSERT INTO stream_match_cache
+        (fingerprint, group_id, stream_id, stream_name,
+         event_id, league, cached_event_data, last_seen_generation,
+         match_method, user_corrected,
+         created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    ON CONFLICT (fingerprint)
+    DO UPDATE SET
+        event_id = excluded.event_id,
+        league = excluded.league,
+        cached_event_data = excluded.cached_event_data,
+        last_seen_generation = excluded.last_seen_generation,
+        match_method = excluded.match_method,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE user_corrected = 0  -- Don't overwrite user corrections
+"""
+
+_TOUCH_SQL = """
+    UPDATE stream_match_cache
+    SET last_seen_generation = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE fingerprint = ?
+"""
+
+# SQLite bound-parameter limit is 999 on older builds
+_MAX_IN_PARAMS = 500
+
 
 def compute_fingerprint(group_id: int, stream_id: int, stream_name: str) -> str:
     """Compute SHA256 fingerprint for cache lookup.
@@ -59,12 +99,45 @@ class StreamCacheEntry:
     cached_data: dict[str, Any]
     match_method: str | None = None
     user_corrected: bool = False
+    last_seen_generation: int = 0
 
 
 # Sentinel value for failed match cache entries
 FAILED_MATCH_EVENT_ID = "__FAILED__"
 
 
+@dataclass
+class _CacheBatch:
+    """Preloaded entries and buffered writes for a batch of streams."""
+
+    # fingerprint -> entry, None when the stream had no cache row
+    entries: dict[str, StreamCacheEntry | None] = field(default_factory=dict)
+    # fingerprint -> generation
+    touches: dict[str, int] = field(default_factory=dict)
+    # fingerprint -> upsert params
+    sets: dict[str, tuple] = field(default_factory=dict)
+
+
+def _row_to_entry(row: sqlite3.Row) -> StreamCacheEntry:
+    """Build a StreamCacheEntry from a stream_match_cache row."""
+    # Parse cached_event_data if present
+    cached_data = {}
+    if row["cached_event_data"]:
+        try:
+            cached_data = json.loads(row["cached_event_data"])
+        except json.JSONDecodeError:
+            cached_data = {}
+
+    return StreamCacheEntry(
+        event_id=row["event_id"],
+        league=row["league"],
+        cached_data=cached_data,
+        match_method=row["match_method"],
+        user_corrected=bool(row["user_corrected"]),
+        last_seen_generation=row["last_seen_generation"] or 0,
+    )
+
+
 class StreamMatchCache:
     """Manages stream fingerprint cache for EPG optimization.
 
@@ -83,6 +156,13 @@ class StreamMatchCache:
     # Purge failed match entries more aggressively
     PURGE_FAILED_AFTER_GENERATIONS = 2
 
+    # In a batch, skip touching entries seen fewer than this many generations
+    # ago; kept well below PURGE_AFTER_GENERATIONS so live entries never expire
+    TOUCH_AFTER_GENERATIONS = 2
+
+    # Buffered batch writes are flushed once this many are pending
+    BATCH_FLUSH_SIZE = 256
+
     def __init__(self, get_connection: Callable):
         """Initialize cache with database connection factory.
 
@@ -98,6 +178,80 @@ class StreamMatchCache:
             "failed_cached": 0,
             "user_corrections": 0,
         }
+        # Active batch (see begin_batch), None when reading/writing per call
+        self._batch: _CacheBatch | None = None
+
+    def begin_batch(self, group_id: int, streams: list[dict]) -> None:
+        """Preload cache entries for a batch of streams and buffer writes.
+
+        Until end_batch(), get() is served from the preloaded entries and
+        set()/touch() are queued and written with executemany, so a matching
+        run costs a few queries instead of several per stream.
+
+        Args:
+            group_id: Event group ID
+            streams: Stream dicts with 'id' and 'name' keys
+        """
+        batch = _CacheBatch()
+        fingerprints = [
+            compute_fingerprint(group_id, s.get("id", 0), s.get("name", "")) for s in streams
+        ]
+        batch.entries = dict.fromkeys(fingerprints)
+
+        try:
+            with self._get_connection() as conn:
+                for i in range(0, len(fingerprints), _MAX_IN_PARAMS):
+                    chunk = fingerprints[i : i + _MAX_IN_PARAMS]
+                    placeholders = ", ".join("?" * len(chunk))
+                    cursor = conn.execute(
+                        f"SELECT {_SELECT_ENTRY_COLUMNS} FROM stream_match_cache "
+                        f"WHERE fingerprint IN ({placeholders})",
+                        chunk,
+                    )
+                    for row in cursor:
+                        batch.entries[row["fingerprint"]] = _row_to_entry(row)
+        except sqlite3.Error as e:
+            # Fall back to per-call lookups
+            logger.warning("[STREAM_CACHE_ERROR] Batch preload failed: %s", e)
+            batch.entries = {}
+
+        self._batch = batch
+
+    def end_batch(self) -> None:
+        """Flush buffered writes and leave batch mode."""
+        if self._batch is None:
+            return
+        self.flush()
+        self._batch = None
+
+    def flush(self) -> None:
+        """Write buffered batch touches and sets in one transaction."""
+        batch = self._batch
+        if batch is None or not (batch.touches or batch.sets):
+            return
+
+        touches = [(generation, fp) for fp, generation in batch.touches.items()]
+        sets = list(batch.sets.values())
+        batch.touches = {}
+        batch.sets = {}
+
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(_TOUCH_SQL, touches)
+                conn.executemany(_UPSERT_MATCH_SQL, sets)
+                conn.commit()
+            logger.debug(
+                "[STREAM_CACHE_FLUSH] touched=%d set=%d",
+                len(touches),
+                len(sets),
+            )
+        except sqlite3.Error as e:
+            logger.error("[STREAM_CACHE_ERROR] Batch flush failed: %s", e)
+
+    def _flush_if_full(self) -> None:
+        batch = self._batch
+        if batch is not None and len(batch.touches) + len(batch.sets) >= self.BATCH_FLUSH_SIZE:
+            self.flush()
 
     def get(
         self,
@@ -119,46 +273,28 @@ class StreamMatchCache:
         """
         fingerprint = compute_fingerprint(group_id, stream_id, stream_name)
 
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT event_id, league, cached_event_data, match_method, user_corrected
-                FROM stream_match_cache
-                WHERE fingerprint = ?
-                """,
-                (fingerprint,),
-            )
-            row = cursor.fetchone()
-
-            if row:
-                # Skip failed matches unless explicitly requested
-                if row["event_id"] == FAILED_MATCH_EVENT_ID and not include_failed:
-                    self._stats["misses"] += 1
-                    return None
+        if self._batch is not None and fingerprint in self._batch.entries:
+            entry = self._batch.entries[fingerprint]
+        else:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    f"SELECT {_SELECT_ENTRY_COLUMNS} FROM stream_match_cache WHERE fingerprint = ?",
+                    (fingerprint,),
+                ).fetchone()
+            entry = _row_to_entry(row) if row else None
 
-                self._stats["hits"] += 1
-                logger.debug(
-                    "[STREAM_CACHE_HIT] stream_id=%d event_id=%s", stream_id, row["event_id"]
-                )
+        if entry:
+            # Skip failed matches unless explicitly requested
+            if entry.event_id == FAILED_MATCH_EVENT_ID and not include_failed:
+                self._stats["misses"] += 1
+                return None
 
-                # Parse cached_event_data if present
-                cached_data = {}
-                if row["cached_event_data"]:
-                    try:
-                        cached_data = json.loads(row["cached_event_data"])
-                    except json.JSONDecodeError:
-                        cached_data = {}
-
-                return StreamCacheEntry(
-                    event_id=row["event_id"],
-                    league=row["league"],
-                    cached_data=cached_data,
-                    match_method=row["match_method"],
-                    user_corrected=bool(row["user_corrected"]),
-                )
+            self._stats["hits"] += 1
+            logger.debug("[STREAM_CACHE_HIT] stream_id=%d event_id=%s", stream_id, entry.event_id)
+            return entry
 
-            self._stats["misses"] += 1
-            return None
+        self._stats["misses"] += 1
+        return None
 
     def is_user_corrected(
         self,
@@ -211,39 +347,27 @@ class StreamMatchCache:
         """
         fingerprint = compute_fingerprint(group_id, stream_id, stream_name)
         cached_json = json.dumps(cached_data, default=_json_serializer)
+        params = (
+            fingerprint,
+            group_id,
+            stream_id,
+            stream_name,
+            event_id,
+            league,
+            cached_json,
+            generation,
+            match_method,
+        )
+
+        if self._batch is not None:
+            self._batch.sets[fingerprint] = params
+            self._stats["sets"] += 1
+            self._flush_if_full()
+            return True
 
         try:
             with self._get_connection() as conn:
-                conn.execute(
-                    """
-                    INSERT INTO stream_match_cache
-                        (fingerprint, group_id, stream_id, stream_name,
-                         event_id, league, cached_event_data, last_seen_generation,
-                         match_method, user_corrected,
-                         created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                    ON CONFLICT (fingerprint)
-                    DO UPDATE SET
-                        event_id = excluded.event_id,
-                        league = excluded.league,
-                        cached_event_data = excluded.cached_event_data,
-                        last_seen_generation = excluded.last_seen_generation,
-                        match_method = excluded.match_method,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE user_corrected = 0  -- Don't overwrite user corrections
-                    """,
-                    (
-                        fingerprint,
-                        group_id,
-                        stream_id,
-                        stream_name,
-                        event_id,
-                        league,
-                        cached_json,
-                        generation,
-                        match_method,
-                    ),
-                )
+                conn.execute(_UPSERT_MATCH_SQL, params)
                 conn.commit()
                 self._stats["sets"] += 1
                 logger.debug(
@@ -417,7 +541,8 @@ class StreamMatchCache:
     ) -> bool:
         """Update last_seen_generation for a cached entry.
 
-        Call this when using a cached match to keep it fresh.
+        Call this when using a cached match to keep it fresh. In a batch,
+        entries already touched within TOUCH_AFTER_GENERATIONS are skipped.
 
         Args:
             group_id: Event group ID
@@ -426,20 +551,24 @@ class StreamMatchCache:
             generation: Current EPG generation counter
 
         Returns:
-            True if updated
+            True if updated (always True when buffered in a batch)
         """
         fingerprint = compute_fingerprint(group_id, stream_id, stream_name)
 
+        if self._batch is not None:
+            entry = self._batch.entries.get(fingerprint)
+            if (
+                entry is not None
+                and generation - entry.last_seen_generation < self.TOUCH_AFTER_GENERATIONS
+            ):
+                return True
+            self._batch.touches[fingerprint] = generation
+            self._flush_if_full()
+            return True
+
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute(
-                    """
-                    UPDATE stream_match_cache
-                    SET last_seen_generation = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE fingerprint = ?
-                    """,
-                    (generation, fingerprint),
-                )
+                cursor = conn.execute(_TOUCH_SQL, (generation, fingerprint))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
@@ -531,6 +660,13 @@ class StreamMatchCache:
         """
         fingerprint = compute_fingerprint(group_id, stream_id, stream_name)
 
+        if self._batch is not None:
+            # Drop buffered writes and the preloaded entry for this stream
+            self._batch.touches.pop(fingerprint, None)
+            self._batch.sets.pop(fingerprint, None)
+            if fingerprint in self._batch.entries:
+                self._batch.entries[fingerprint] = None
+
         try:
             with self._get_connection() as conn:
                 cursor = conn.execute(
@@ -653,6 +789,117 @@ def event_to_cache_data(event: Event) -> dict[str, Any]:
     return asdict(event)
 
 
+def cache_data_to_event(cached_data: dict[str, Any]) -> Event | None:
+    """Reconstruct Event from a dict produced by event_to_cache_data().
+
+    Args:
+        cached_data: Cached event dict
+
+    Returns:
+        Event, or None if the data could not be parsed
+    """
+    try:
+        # Handle datetime parsing
+        start_time = cached_data.get("start_time")
+        if isinstance(start_time, str):
+            start_time = datetime.fromisoformat(start_time)
+
+        # Reconstruct teams (use `or {}` to handle explicit None values)
+        home_data = cached_data.get("home_team") or {}
+        away_data = cached_data.get("away_team") or {}
+
+        home_team = Team(
+            id=home_data.get("id", ""),
+            provider=home_data.get("provider", ""),
+            name=home_data.get("name", ""),
+            short_name=home_data.get("short_name", ""),
+            abbreviation=home_data.get("abbreviation", ""),
+            league=home_data.get("league", ""),
+            sport=home_data.get("sport", ""),
+            logo_url=home_data.get("logo_url"),
+            color=home_data.get("color"),
+        )
+
+        away_team = Team(
+            id=away_data.get("id", ""),
+            provider=away_data.get("provider", ""),
+            name=away_data.get("name", ""),
+            short_name=away_data.get("short_name", ""),
+            abbreviation=away_data.get("abbreviation", ""),
+            league=away_data.get("league", ""),
+            sport=away_data.get("sport", ""),
+            logo_url=away_data.get("logo_url"),
+            color=away_data.get("color"),
+        )
+
+        status_data = cached_data.get("status") or {}
+        status = EventStatus(
+            state=status_data.get("state", "scheduled"),
+            detail=status_data.get("detail"),
+            period=status_data.get("period"),
+            clock=status_data.get("clock"),
+        )
+
+        # Handle broadcast/broadcasts field compatibility
+        broadcast_val = cached_data.get("broadcasts") or cached_data.get("broadcast")
+        broadcasts = (
+            broadcast_val
+            if isinstance(broadcast_val, list)
+            else [broadcast_val]
+            if broadcast_val
+            else []
+        )
+
+        # Reconstruct Venue from dict if present
+        venue_data = cached_data.get("venue")
+        venue = None
+        if venue_data:
+            if isinstance(venue_data, dict):
+                venue = Venue(
+                    name=venue_data.get("name", ""),
+                    city=venue_data.get("city"),
+                    state=venue_data.get("state"),
+                    country=venue_data.get("country"),
+                )
+            else:
+                venue = venue_data  # Already a Venue
+
+        # Reconstruct segment_times for UFC events
+        # Use `or {}` to handle both missing key AND explicit None value
+        segment_times_data = cached_data.get("segment_times") or {}
+        segment_times = {}
+        for seg_name, seg_time in segment_times_data.items():
+            if isinstance(seg_time, str):
+                segment_times[seg_name] = datetime.fromisoformat(seg_time)
+            elif seg_time is not None:
+                segment_times[seg_name] = seg_time
+
+        # Parse main_card_start if present
+        main_card_start = cached_data.get("main_card_start")
+        if isinstance(main_card_start, str):
+            main_card_start = datetime.fromisoformat(main_card_start)
+
+        return Event(
+            id=cached_data.get("id", ""),
+            provider=cached_data.get("provider", ""),
+            name=cached_data.get("name", ""),
+            short_name=cached_data.get("short_name"),
+            start_time=start_time,
+            home_team=home_team,
+            away_team=away_team,
+            status=status,
+            league=cached_data.get("league", ""),
+            sport=cached_data.get("sport", ""),
+            venue=venue,
+            broadcasts=broadcasts,
+            segment_times=segment_times,
+            main_card_start=main_card_start,
+        )
+    except Exception as e:
+        logger.warning("[MATCH_CACHE] Failed to reconstruct event from cache: %s", e)
+        return None
+
+
 def _json_serializer(obj: Any) -> Any:
     """JSON serializer for datetime objects."""
     if isinstance(obj, datetime):
@@ -12,7 +12,7 @@ This is the main entry point for team-based EPG generation from the scheduler.
 import logging
 import os
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
@@ -619,6 +619,22 @@ def get_all_team_xmltv(conn: Connection, team_ids: list[int] | None = None) -> l
     Returns:
         List of XMLTV content strings
     """
+    return list(iter_all_team_xmltv(conn, team_ids))
+
+
+def iter_all_team_xmltv(conn: Connection, team_ids: list[int] | None = None) -> Iterator[str]:
+    """Yield stored XMLTV content for enabled teams one row at a time.
+
+    Lets the EPG merge consume team XMLTV without holding every document
+    in a list first. The connection must stay open until exhausted.
+
+    Args:
+        conn: Database connection
+        team_ids: Optional list of team IDs to filter (None = all enabled)
+
+    Yields:
+        XMLTV content strings
+    """
     try:
         if team_ids:
             placeholders = ",".join("?" * len(team_ids))
@@ -638,10 +654,10 @@ def get_all_team_xmltv(conn: Connection, team_ids: list[int] | None = None) -> l
                    AND x.xmltv_content IS NOT NULL AND x.xmltv_content != ''"""
             )
 
-        return [row["xmltv_content"] for row in cursor.fetchall()]
+        for row in cursor:
+            yield row["xmltv_content"]
     except Exception as e:
         logger.debug("[XMLTV] Failed to get team content: %s", e)
-        return []
 
 
 # =============================================================================
@@ -15,8 +15,10 @@ Timezone disambiguation uses three-tier priority:
 
 import logging
 import re
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from teamarr.consumers.matching.classifier import (
@@ -24,8 +26,9 @@ from teamarr.consumers.matching.classifier import (
     detect_card_segment,
     is_combat_sports_excluded,
 )
-from teamarr.consumers.matching.normalizer import TZ_ABBREVIATION_MAP
+from teamarr.consumers.matching.normalizer import TZ_ABBREVIATION_MAP, compile_case_variants
 from teamarr.core.types import Event
+from teamarr.utilities.tz import get_user_timezone
 
 logger = logging.getLogger(__name__)
 
@@ -39,11 +42,56 @@ SEGMENT_DISPLAY_NAMES: dict[str, str] = {
 
 # Segment codes ordered from earliest to latest
 SEGMENT_ORDER = ["early_prelims", "prelims", "main_card"]
+_SEGMENT_ORDER_INDEX: dict[str, int] = {s: i for i, s in enumerate(SEGMENT_ORDER)}
+# Closest-segment search order per position: same or later first, then earlier
+_FALLBACK_ORDER: dict[int, tuple[str, ...]] = {
+    i: (*SEGMENT_ORDER[i:], *reversed(SEGMENT_ORDER[:i])) for i in range(len(SEGMENT_ORDER))
+}
 
 # Maximum distance (in minutes) for time-based segment detection
 # If stream time is more than this far from any segment, ignore the time
 MAX_SEGMENT_TIME_DISTANCE_MINUTES = 60
 
+# Stream time patterns, compiled once (TZ alternatives from normalizer's map)
+_TZ_ABBREVS = "|".join(re.escape(k) for k in TZ_ABBREVIATION_MAP.keys())
+# 12-hour format with minutes - "5:30 PM ET", "5:30PM EST"
+_TIME_12H_MINUTES_PATTERN = rf"\b(\d{{1,2}}):(\d{{2}})\s*(am|pm)\s*({_TZ_ABBREVS})?\b"
+# 12-hour format without minutes - "10pm ET", "10 pm EST"
+_TIME_12H_PATTERN = rf"\b(\d{{1,2}})\s*(am|pm)\s*({_TZ_ABBREVS})?\b"
+# 24-hour format - "22:30" (no TZ typically)
+_TIME_24H_PATTERN = r"\b([01]?\d|2[0-3]):([0-5]\d)\b"
+
+# (ASCII, IGNORECASE) variants, as for the normalizer's datetime patterns
+_TIME_12H_MINUTES_RES = compile_case_variants(_TIME_12H_MINUTES_PATTERN)
+_TIME_12H_RES = compile_case_variants(_TIME_12H_PATTERN)
+_TIME_24H_RES = compile_case_variants(_TIME_24H_PATTERN)
+_DIGIT_RE = re.compile(r"\d")
+# All three in one pass: finds where the earliest time of any format starts
+_TIME_ANY_RES = compile_case_variants(
+    f"{_TIME_12H_MINUTES_PATTERN}|{_TIME_12H_PATTERN}|{_TIME_24H_PATTERN}"
+)
+
+
+@lru_cache(maxsize=512)
+def _closest_espn_segment(detected: str, espn_segments: tuple[str, ...]) -> str:
+    """Map a segment missing from ESPN's data to the closest one ESPN has.
+
+    Pure function of its arguments, so it runs once per (segment, event
+    segment keys) rather than once per stream. espn_segments keeps ESPN's
+    key order, which picks the last-resort fallback deterministically.
+    """
+    # Priority: next available segment in order, then earlier ones
+    detected_idx = _SEGMENT_ORDER_INDEX.get(detected)
+    if detected_idx is not None:
+        for segment in _FALLBACK_ORDER[detected_idx]:
+            if segment in espn_segments:
+                return segment
+
+    # Last resort: use main_card if available, else first available
+    if "main_card" in espn_segments:
+        return "main_card"
+    return espn_segments[0]
+
 
 def canonicalize_segment(detected: str, event: Event) -> str:
     """Validate detected segment against ESPN's segment_times.
@@ -62,46 +110,24 @@ def canonicalize_segment(detected: str, event: Event) -> str:
     if not event.segment_times:
         return detected
 
-    espn_segments = set(event.segment_times.keys())
-
     # If detected segment exists in ESPN data, use it
-    if detected in espn_segments:
+    if detected in event.segment_times:
         return detected
 
-    # Map to closest valid segment
-    # Priority: try to find the next available segment in order
-    detected_idx = SEGMENT_ORDER.index(detected) if detected in SEGMENT_ORDER else -1
+    espn_segments = tuple(event.segment_times)
+    segment = _closest_espn_segment(detected, espn_segments)
 
-    if detected_idx >= 0:
-        # Try segments at same position or later first
-        for segment in SEGMENT_ORDER[detected_idx:]:
-            if segment in espn_segments:
-                logger.info(
-                    "[UFC_SEGMENTS] Mapped '%s' to '%s' (not in ESPN data: %s)",
-                    detected,
-                    segment,
-                    sorted(espn_segments),
-                )
-                return segment
-        # Fall back to earlier segments
-        for segment in reversed(SEGMENT_ORDER[:detected_idx]):
-            if segment in espn_segments:
-                logger.info(
-                    "[UFC_SEGMENTS] Mapped '%s' to '%s' (not in ESPN data: %s)",
-                    detected,
-                    segment,
-                    sorted(espn_segments),
-                )
-                return segment
-
-    # Last resort: use main_card if available, else first available
-    if "main_card" in espn_segments:
-        logger.warning("[UFC_SEGMENTS] Unknown segment '%s', defaulting to main_card", detected)
-        return "main_card"
-
-    fallback = next(iter(espn_segments))
-    logger.warning("[UFC_SEGMENTS] Unknown segment '%s', defaulting to '%s'", detected, fallback)
-    return fallback
+    if detected in _SEGMENT_ORDER_INDEX and segment in _SEGMENT_ORDER_INDEX:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[UFC_SEGMENTS] Mapped '%s' to '%s' (not in ESPN data: %s)",
+                detected,
+                segment,
+                sorted(espn_segments),
+            )
+    else:
+        logger.warning("[UFC_SEGMENTS] Unknown segment '%s', defaulting to '%s'", detected, segment)
+    return segment
 
 
 def extract_time_and_tz_from_stream(stream_name: str) -> tuple[time | None, str | None]:
@@ -118,21 +144,38 @@ def extract_time_and_tz_from_stream(stream_name: str) -> tuple[time | None, str
     Returns:
         Tuple of (extracted time, IANA timezone name or None)
     """
-    if not stream_name:
+    # Every time pattern needs a digit; most stream names have none
+    if not stream_name or not _DIGIT_RE.search(stream_name):
         return None, None
 
-    # Build TZ abbreviation pattern from normalizer's map
-    tz_abbrevs = "|".join(re.escape(k) for k in TZ_ABBREVIATION_MAP.keys())
+    # ASCII names are matched lowercased against the case-sensitive variants
+    # (RE2 when installed); lowering ASCII keeps the match positions
+    lowered = stream_name.lower()
+    if stream_name.isascii():
+        text, variant = lowered, 0
+    else:
+        text, variant = stream_name, 1
+
+    # The 12-hour patterns need "am"/"pm" and the others need ":"; each
+    # pattern is only run when its literals are present
+    has_ampm = "am" in lowered or "pm" in lowered
+    has_colon = ":" in stream_name
+    if not has_ampm and not has_colon:
+        return None, None
+
+    # One combined scan rules out names without any time. The patterns keep
+    # their priority order below, each searching from where the combined
+    # match starts, since no pattern can match before that position.
+    first = _TIME_ANY_RES[variant].search(text)
+    if not first:
+        return None, None
+    pos = first.start()
 
     extracted_time = None
     extracted_tz = None
 
     # Pattern 1: 12-hour format with minutes - "5:30 PM ET", "5:30PM EST"
-    match = re.search(
-        rf"\b(\d{{1,2}}):(\d{{2}})\s*(am|pm)\s*({tz_abbrevs})?\b",
-        stream_name,
-        re.IGNORECASE,
-    )
+    match = _TIME_12H_MINUTES_RES[variant].search(text, pos) if has_ampm and has_colon else None
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2))
@@ -148,11 +191,7 @@ def extract_time_and_tz_from_stream(stream_name: str) -> tuple[time | None, str
         return extracted_time, extracted_tz
 
     # Pattern 2: 12-hour format without minutes - "10pm ET", "10 pm EST"
-    match = re.search(
-        rf"\b(\d{{1,2}})\s*(am|pm)\s*({tz_abbrevs})?\b",
-        stream_name,
-        re.IGNORECASE,
-    )
+    match = _TIME_12H_RES[variant].search(text, pos) if has_ampm else None
     if match:
         hour = int(match.group(1))
         ampm = match.group(2).upper()
@@ -167,7 +206,7 @@ def extract_time_and_tz_from_stream(stream_name: str) -> tuple[time | None, str
         return extracted_time, extracted_tz
 
     # Pattern 3: 24-hour format - "22:30" (no TZ typically)
-    match = re.search(r"\b([01]?\d|2[0-3]):([0-5]\d)\b", stream_name)
+    match = _TIME_24H_RES[variant].search(text, pos) if has_colon else None
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2))
@@ -204,7 +243,8 @@ def is_ufc_event(event: Event | None) -> bool:
     """Check if event is a UFC/MMA event that should have segment handling."""
     if not event:
         return False
-    return event.sport == "mma" and event.league == "ufc"
+    # League first: it rules out far more events than sport does
+    return event.league == "ufc" and event.sport == "mma"
 
 
 def get_stream_segment(stream: dict, classified: ClassifiedStream | None = None) -> str | None:
@@ -270,8 +310,6 @@ def determine_segment_from_time(
     Returns:
         Segment code or None if can't determine
     """
-    from teamarr.utilities.tz import get_user_timezone
-
     if not event.segment_times:
         return None
 
@@ -305,15 +343,11 @@ def determine_segment_from_time(
     stream_dt_local = datetime.combine(event_date, stream_time, tzinfo=effective_tz)
     stream_dt_utc = stream_dt_local.astimezone(ZoneInfo("UTC"))
 
-    # Find closest segment
-    best_segment = None
-    best_distance = float("inf")
-
-    for segment_code, segment_dt in event.segment_times.items():
-        distance = abs((stream_dt_utc - segment_dt).total_seconds())
-        if distance < best_distance:
-            best_distance = distance
-            best_segment = segment_code
+    # Find closest segment; timedeltas compare directly, seconds are taken once
+    best_segment, best_dt = min(
+        event.segment_times.items(), key=lambda item: abs(stream_dt_utc - item[1])
+    )
+    best_distance = abs(stream_dt_utc - best_dt).total_seconds()
 
     if best_segment:
         best_distance_min = best_distance // 60
@@ -365,8 +399,6 @@ def disambiguate_prelims_by_time(
     Returns:
         Disambiguated segment code
     """
-    from teamarr.utilities.tz import get_user_timezone
-
     # Only disambiguate "prelims" - other segments are unambiguous
     if detected_segment != "prelims":
         return detected_segment
@@ -413,14 +445,10 @@ def disambiguate_prelims_by_time(
     stream_dt_local = datetime.combine(event_date, stream_time, tzinfo=effective_tz)
     stream_dt_utc = stream_dt_local.astimezone(ZoneInfo("UTC"))
 
-    # Calculate time differences in seconds
-    def datetime_distance(dt1: datetime, dt2: datetime) -> int:
-        """Calculate absolute distance in seconds, handling day boundaries."""
-        diff = abs((dt1 - dt2).total_seconds())
-        return int(diff)
-
-    dist_to_early = datetime_distance(stream_dt_utc, early_prelims_dt)
-    dist_to_prelims = datetime_distance(stream_dt_utc, prelims_dt)
+    # Absolute time differences in whole seconds (aware datetimes, so day
+    # boundaries are handled by the subtraction)
+    dist_to_early = int(abs((stream_dt_utc - early_prelims_dt).total_seconds()))
+    dist_to_prelims = int(abs((stream_dt_utc - prelims_dt).total_seconds()))
 
     # Simple "closest to" logic - assign to whichever segment is closer
     if dist_to_early < dist_to_prelims:
@@ -464,19 +492,20 @@ def get_segment_times(
         start_time = event.segment_times[segment]
 
         # End time = next segment's start, or estimated duration for last segment
-        segment_list = [s for s in SEGMENT_ORDER if s in event.segment_times]
-        try:
-            seg_idx = segment_list.index(segment)
-            if seg_idx < len(segment_list) - 1:
+        seg_idx = _SEGMENT_ORDER_INDEX.get(segment)
+        if seg_idx is None:
+            end_time = start_time + timedelta(hours=mma_duration / 3)
+        else:
+            next_segment = next(
+                (s for s in SEGMENT_ORDER[seg_idx + 1 :] if s in event.segment_times), None
+            )
+            if next_segment:
                 # Not the last segment - end at next segment's start
-                next_segment = segment_list[seg_idx + 1]
                 end_time = event.segment_times[next_segment]
             else:
                 # Last segment - use estimated duration
                 # Main card typically runs 2-3 hours
                 end_time = start_time + timedelta(hours=mma_duration / 2)
-        except ValueError:
-            end_time = start_time + timedelta(hours=mma_duration / 3)
 
         return start_time, end_time
 
@@ -542,33 +571,44 @@ def expand_ufc_segments(
 
     # Group UFC streams by event ID and segment
     # {event_id: {segment: [streams]}}
-    ufc_by_segment: dict[str, dict[str, list[dict]]] = {}
+    ufc_by_segment: dict[str, dict[str, list[dict]]] = defaultdict(lambda: defaultdict(list))
+    # Summary counts, kept while grouping rather than recounted afterwards
+    ufc_count = 0
+    segment_count = 0
+
+    # Loop-invariant lookups bound to locals for the per-stream loop
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
     for match in matched_streams:
         event = match.get("event")
-        stream = match.get("stream", {})
 
         # Non-UFC events pass through unchanged
         if not is_ufc_event(event):
             result.append(match)
             continue
 
+        # Name read once; the exclusion and segment checks below take it directly
+        stream_name = match.get("stream", {}).get("name", "")
+
         # Check for excluded streams (weigh-ins, etc.)
-        if should_exclude_stream(stream):
-            logger.debug(
-                "[UFC_SEGMENTS] Excluding stream '%s' (non-event content)",
-                stream.get("name", "")[:50],
-            )
+        if is_combat_sports_excluded(stream_name):
+            if debug_enabled:
+                logger.debug(
+                    "[UFC_SEGMENTS] Excluding stream '%s' (non-event content)",
+                    stream_name[:50],
+                )
             continue
 
         # Use pre-detected segment from classifier, or detect from stream name
-        segment = match.get("card_segment") or get_stream_segment(stream)
-        stream_name = stream.get("name", "")
+        segment = match.get("card_segment") or detect_card_segment(stream_name)
 
         # Combined streams go to main_card
         if segment == "combined":
             segment = "main_card"
 
+        # Stream time is parsed at most once, by whichever step below needs it
+        stream_time = extracted_tz = None
+
         # If no segment keyword detected, try to determine from time
         if not segment:
             stream_time, extracted_tz = extract_time_and_tz_from_stream(stream_name)
@@ -588,7 +628,8 @@ def expand_ufc_segments(
         # Streams labeled "prelims" might actually be early prelims based on time
         # Uses three-tier TZ: extracted from stream > group setting > user TZ
         if segment == "prelims":
-            stream_time, extracted_tz = extract_time_and_tz_from_stream(stream_name)
+            if stream_time is None:
+                stream_time, extracted_tz = extract_time_and_tz_from_stream(stream_name)
             if stream_time:
                 segment = disambiguate_prelims_by_time(
                     segment,
@@ -601,16 +642,12 @@ def expand_ufc_segments(
         # Validate against ESPN's segment data - ensures segment exists
         segment = canonicalize_segment(segment, event)
 
-        event_id = event.id
-        if event_id not in ufc_by_segment:
-            ufc_by_segment[event_id] = {}
-        if segment not in ufc_by_segment[event_id]:
-            ufc_by_segment[event_id][segment] = []
-
-        ufc_by_segment[event_id][segment].append(match)
+        ufc_by_segment[event.id][segment].append(match)
+        ufc_count += 1
 
     # Create segment entries for each UFC event
     for event_id, segments in ufc_by_segment.items():
+        segment_count += len(segments)
         # Get the event from any stream (they all have the same event)
         first_match = next(iter(next(iter(segments.values()))))
         event = first_match.get("event")
@@ -624,20 +661,22 @@ def expand_ufc_segments(
             if not streams_for_segment:
                 continue
 
-            # Get exact segment timing from ESPN data
+            # Get exact segment timing from ESPN data (shared by the segment's streams)
             start_time, end_time = get_segment_times(event, segment, sport_durations)
+            segment_display = SEGMENT_DISPLAY_NAMES.get(segment, "")
 
-            # Create segment entry with metadata
-            for match in streams_for_segment:
-                segment_match = {
+            # Create segment entry with metadata; only the stream varies per entry
+            result.extend(
+                {
                     "stream": match.get("stream"),
                     "event": event,
                     "segment": segment,
-                    "segment_display": SEGMENT_DISPLAY_NAMES.get(segment, ""),
+                    "segment_display": segment_display,
                     "segment_start": start_time,
                     "segment_end": end_time,
                 }
-                result.append(segment_match)
+                for match in streams_for_segment
+            )
 
             logger.debug(
                 "[UFC_SEGMENTS] Event %s segment '%s': %d streams, %s - %s",
@@ -649,8 +688,6 @@ def expand_ufc_segments(
             )
 
     # Log summary
-    ufc_count = sum(len(streams) for segs in ufc_by_segment.values() for streams in segs.values())
-    segment_count = sum(len(segs) for segs in ufc_by_segment.values())
     if ufc_count > 0:
         logger.info(
             "[UFC_SEGMENTS] Expanded %d UFC streams into %d segment channels",
@@ -8,6 +8,8 @@ This module provides normalization logic to map external API sport names
 (like "Ice Hockey", "Rugby League") to our canonical lowercase codes.
 """
 
+from time import monotonic
+
 # Map external API sport names to canonical codes
 # This is normalization LOGIC, not data - handles how providers name sports
 SPORT_ALIASES: dict[str, str] = {
@@ -42,6 +44,11 @@ SPORT_ALIASES: dict[str, str] = {
     "futbol": "soccer",
 }
 
+# SPORT_ALIASES keyed by lowercase name, so one lookup covers any casing
+_SPORT_ALIASES_LOWER: dict[str, str] = {
+    alias.lower(): code for alias, code in SPORT_ALIASES.items()
+}
+
 
 def normalize_sport(sport: str) -> str:
     """Normalize a sport name to canonical lowercase code.
@@ -66,27 +73,40 @@ def normalize_sport(sport: str) -> str:
     if not sport:
         return "unknown"
 
-    # Check alias map (handles title case from APIs like "Ice Hockey")
-    if sport in SPORT_ALIASES:
-        return SPORT_ALIASES[sport]
-
-    # Check lowercase in aliases
+    # Check alias map case-insensitively (handles title case from APIs like "Ice Hockey");
+    # unknown sports are returned as lowercase (may or may not be a valid sport in DB)
     lower = sport.lower().strip()
-    if lower in SPORT_ALIASES:
-        return SPORT_ALIASES[lower]
+    return _SPORT_ALIASES_LOWER.get(lower, lower)
+
 
-    # Return as lowercase (may or may not be a valid sport in DB)
-    return lower
+# The sports table only changes through migrations, so display names are
+# re-read at most once per TTL instead of on every call
+_DISPLAY_NAMES_TTL_SECONDS = 300.0
+_display_names_cache: tuple[float, dict[str, str]] | None = None
 
 
 def get_sport_display_names_from_db(conn) -> dict[str, str]:
     """Get all sport display names from database.
 
+    Results are cached for _DISPLAY_NAMES_TTL_SECONDS; callers get their own copy.
+
     Args:
         conn: Database connection
 
     Returns:
         Dict mapping sport_code to display_name
     """
-    cursor = conn.execute("SELECT sport_code, display_name FROM sports")
-    return {row["sport_code"]: row["display_name"] for row in cursor.fetchall()}
+    global _display_names_cache
+    cached = _display_names_cache
+    now = monotonic()
+    if cached is None or now >= cached[0]:
+        cursor = conn.execute("SELECT sport_code, display_name FROM sports")
+        names = {row["sport_code"]: row["display_name"] for row in cursor.fetchall()}
+        cached = _display_names_cache = (now + _DISPLAY_NAMES_TTL_SECONDS, names)
+    return dict(cached[1])
+
+
+def clear_sport_display_names_cache() -> None:
+    """Drop cached display names (e.g. after changing the sports table)."""
+    global _display_names_cache
+    _display_names_cache = None
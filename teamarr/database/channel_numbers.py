@@ -81,6 +81,57 @@ def get_next_channel_number(
     Returns:
         Next available channel number, or None if disabled/would exceed max
     """
+    allocation = _resolve_channel_allocation(conn, group_id, auto_assign)
+    if not allocation:
+        return None
+
+    channel_start, block_end, use_global_pool = allocation
+    if use_global_pool:
+        # Strict compact: find next available globally across all AUTO groups
+        return get_next_compact_channel_number(conn)
+
+    # Find the first available number starting from channel_start
+    next_num = _find_first_free_channel(conn, group_id, channel_start)
+
+    # For AUTO mode with block reservation, enforce block_end limit
+    if block_end and next_num > block_end:
+        logger.warning(
+            "[CHANNEL_NUM] Group %d AUTO range exhausted (%d-%d)",
+            group_id,
+            channel_start,
+            block_end,
+        )
+        return None
+
+    # Check global max
+    if next_num > MAX_CHANNEL:
+        logger.warning("[CHANNEL_NUM] Channel number %d exceeds max %d", next_num, MAX_CHANNEL)
+        return None
+
+    return next_num
+
+
+def _resolve_channel_allocation(
+    conn: Connection,
+    group_id: int,
+    auto_assign: bool = True,
+) -> tuple[int, int | None, bool] | None:
+    """Resolve where a group's channel numbers are allocated from.
+
+    Shared by get_next_channel_number and reassign_out_of_range_channels_batch
+    so both apply the same start, block end and pool for each numbering mode.
+
+    Args:
+        conn: Database connection
+        group_id: The event group ID
+        auto_assign: If True, auto-assign channel_start when missing (MANUAL mode only)
+
+    Returns:
+        Tuple of (channel_start, block_end, use_global_pool), or None if the
+        group has no usable start. block_end is None when only MAX_CHANNEL
+        applies; use_global_pool is True in strict_compact mode, where all
+        AUTO groups share the global range.
+    """
     cursor = conn.execute(
         """SELECT channel_start_number, channel_assignment_mode, sort_order
            FROM event_epg_groups WHERE id = ?""",
@@ -93,17 +144,17 @@ def get_next_channel_number(
     channel_start = group["channel_start_number"]
     assignment_mode = group["channel_assignment_mode"] or "manual"
 
-    # Get the numbering mode for AUTO groups
-    numbering_mode = get_channel_numbering_mode(conn)
-
     # For AUTO mode, calculate effective channel_start dynamically
     block_end = None
     if assignment_mode == "auto":
+        # Get the numbering mode for AUTO groups
+        numbering_mode = get_channel_numbering_mode(conn)
+
         # For strict_compact mode, use global allocation across all AUTO groups
         if numbering_mode == "strict_compact":
-            # Strict compact: find next available globally across all AUTO groups
-            # Skip the per-group logic entirely - return the globally available number
-            return get_next_compact_channel_number(conn)
+            # Skip the per-group logic entirely - the global range applies
+            range_start, range_end = get_global_channel_range(conn)
+            return range_start, range_end, True
 
         # strict_block or rational_block: use block-based calculation
         channel_start = _calculate_auto_channel_start(
@@ -144,44 +195,58 @@ def get_next_channel_number(
     if not channel_start:
         return None
 
-    # Get all active channel numbers for this group
-    # Note: channel_number may be stored as TEXT or INTEGER, so cast to int
-    used_rows = conn.execute(
+    return channel_start, block_end, False
+
+
+def _get_group_used_channels(conn: Connection, group_id: int) -> set[int]:
+    """Get all active channel numbers used by a single group.
+
+    Note: channel_number may be stored as TEXT or INTEGER, so cast to int.
+
+    Returns:
+        Set of used channel numbers in the group
+    """
+    cursor = conn.execute(
         """SELECT channel_number FROM managed_channels
-           WHERE event_epg_group_id = ? AND deleted_at IS NULL
-           ORDER BY channel_number""",
+           WHERE event_epg_group_id = ? AND deleted_at IS NULL""",
         (group_id,),
-    ).fetchall()
+    )
+
     used_set = set()
-    for row in used_rows:
+    for row in cursor.fetchall():
         if row["channel_number"]:
             try:
                 used_set.add(int(float(row["channel_number"])))
             except (ValueError, TypeError):
                 pass  # Skip invalid channel numbers
+    return used_set
 
-    # Find the first available number starting from channel_start
-    next_num = channel_start
-    while next_num in used_set:
-        next_num += 1
 
-    # For AUTO mode with block reservation, enforce block_end limit
-    if block_end and next_num > block_end:
-        logger.warning(
-            "[CHANNEL_NUM] Group %d AUTO range exhausted (%d-%d, mode=%s)",
-            group_id,
-            channel_start,
-            block_end,
-            numbering_mode,
-        )
-        return None
+def _find_first_free_channel(conn: Connection, group_id: int, channel_start: int) -> int:
+    """Find the first channel number >= channel_start not used by a group.
 
-    # Check global max
-    if next_num > MAX_CHANNEL:
-        logger.warning("[CHANNEL_NUM] Channel number %d exceeds max %d", next_num, MAX_CHANNEL)
-        return None
+    Lets SQLite find the gap (start itself, or the lowest used number at or
+    above start whose successor is unused) instead of walking a Python set.
 
-    return next_num
+    Note: channel_number may be stored as TEXT or INTEGER; the double cast
+    matches the int(float()) conversion used elsewhere.
+    """
+    row = conn.execute(
+        """WITH used AS (
+               SELECT DISTINCT CAST(CAST(channel_number AS REAL) AS INTEGER) AS n
+               FROM managed_channels
+               WHERE event_epg_group_id = ? AND deleted_at IS NULL
+                 AND channel_number IS NOT NULL
+           )
+           SELECT CASE
+               WHEN NOT EXISTS (SELECT 1 FROM used WHERE n = ?) THEN ?
+               ELSE (SELECT MIN(u.n + 1) FROM used u
+                     WHERE u.n >= ?
+                       AND NOT EXISTS (SELECT 1 FROM used v WHERE v.n = u.n + 1))
+           END AS next_num""",
+        (group_id, channel_start, channel_start, channel_start),
+    ).fetchone()
+    return row["next_num"]
 
 
 def _calculate_strict_compact_start(conn: Connection, group_id: int) -> int | None:
@@ -291,19 +356,19 @@ def _get_total_stream_count(conn: Connection, group_id: int) -> int:
     return row["total_stream_count"] if row and row["total_stream_count"] else 0
 
 
-def _get_max_channel_number(conn: Connection, group_id: int) -> int | None:
-    """Get the maximum channel number currently assigned to a group.
+def _get_min_channel_number(conn: Connection, group_id: int) -> int | None:
+    """Get the minimum channel number currently assigned to a group.
 
     Returns None if no channels are assigned.
     """
     cursor = conn.execute(
-        """SELECT MAX(CAST(channel_number AS INTEGER)) as max_ch
+        """SELECT MIN(CAST(channel_number AS INTEGER)) as min_ch
            FROM managed_channels
            WHERE event_epg_group_id = ? AND deleted_at IS NULL""",
         (group_id,),
     )
     row = cursor.fetchone()
-    return row["max_ch"] if row and row["max_ch"] else None
+    return row["min_ch"] if row and row["min_ch"] else None
 
 
 def _calculate_auto_block_end(
@@ -322,14 +387,18 @@ def _calculate_auto_block_end(
     range_start, range_end = get_global_channel_range(conn)
     effective_end = range_end if range_end else MAX_CHANNEL
 
-    # Get all AUTO groups sorted by sort_order, excluding child groups
+    # Get all AUTO groups sorted by sort_order, excluding child groups,
+    # with each group's lowest active channel number in the same query
     auto_groups = conn.execute(
-        """SELECT id, sort_order
-           FROM event_epg_groups
-           WHERE channel_assignment_mode = 'auto'
-             AND parent_group_id IS NULL
-             AND enabled = 1
-           ORDER BY sort_order ASC""",
+        """SELECT g.id, g.sort_order,
+                  (SELECT MIN(CAST(mc.channel_number AS INTEGER))
+                   FROM managed_channels mc
+                   WHERE mc.event_epg_group_id = g.id AND mc.deleted_at IS NULL) AS min_ch
+           FROM event_epg_groups g
+           WHERE g.channel_assignment_mode = 'auto'
+             AND g.parent_group_id IS NULL
+             AND g.enabled = 1
+           ORDER BY g.sort_order ASC""",
     ).fetchall()
 
     # Find the first group AFTER us that has actual channels
@@ -341,7 +410,7 @@ def _calculate_auto_block_end(
 
         if found_self:
             # Check if this group has any channels
-            next_min = _get_min_channel_number(conn, grp["id"])
+            next_min = grp["min_ch"]
             if next_min:
                 # Found a following group with channels - our block ends before theirs
                 return next_min - 1
@@ -369,21 +438,6 @@ def _calculate_blocks_needed(stream_count: int) -> int:
     return (stream_count + 9) // 10
 
 
-def _get_min_channel_number(conn: Connection, group_id: int) -> int | None:
-    """Get the minimum channel number currently assigned to a group.
-
-    Returns None if no channels are assigned.
-    """
-    cursor = conn.execute(
-        """SELECT MIN(CAST(channel_number AS INTEGER)) as min_ch
-           FROM managed_channels
-           WHERE event_epg_group_id = ? AND deleted_at IS NULL""",
-        (group_id,),
-    )
-    row = cursor.fetchone()
-    return row["min_ch"] if row and row["min_ch"] else None
-
-
 def _calculate_auto_channel_start(
     conn: Connection,
     group_id: int,
@@ -440,7 +494,7 @@ def _calculate_strict_block_start(
 
     # Get all AUTO groups sorted by sort_order, excluding child groups
     auto_groups = conn.execute(
-        """SELECT id, sort_order
+        """SELECT id, sort_order, total_stream_count
            FROM event_epg_groups
            WHERE channel_assignment_mode = 'auto'
              AND parent_group_id IS NULL
@@ -470,7 +524,7 @@ def _calculate_strict_block_start(
             return current_start
 
         # Calculate blocks needed based on total raw stream count
-        total_streams = _get_total_stream_count(conn, grp["id"])
+        total_streams = grp["total_stream_count"] or 0
         blocks_needed = _calculate_blocks_needed(total_streams)
         current_start += blocks_needed * 10
 
@@ -505,14 +559,18 @@ def _calculate_rational_block_start(
     range_start, range_end = get_global_channel_range(conn)
     effective_end = range_end if range_end else MAX_CHANNEL
 
-    # Get all AUTO groups sorted by sort_order, excluding child groups
+    # Get all AUTO groups sorted by sort_order, excluding child groups,
+    # with each group's active channel count in the same query
     auto_groups = conn.execute(
-        """SELECT id, sort_order
-           FROM event_epg_groups
-           WHERE channel_assignment_mode = 'auto'
-             AND parent_group_id IS NULL
-             AND enabled = 1
-           ORDER BY sort_order ASC""",
+        """SELECT g.id, g.sort_order,
+                  (SELECT COUNT(*)
+                   FROM managed_channels mc
+                   WHERE mc.event_epg_group_id = g.id AND mc.deleted_at IS NULL) AS cnt
+           FROM event_epg_groups g
+           WHERE g.channel_assignment_mode = 'auto'
+             AND g.parent_group_id IS NULL
+             AND g.enabled = 1
+           ORDER BY g.sort_order ASC""",
     ).fetchall()
 
     # Calculate cumulative block usage up to our group
@@ -537,7 +595,7 @@ def _calculate_rational_block_start(
             return current_start
 
         # Calculate blocks needed based on ACTUAL channel count
-        actual_count = _get_actual_channel_count(conn, grp["id"])
+        actual_count = grp["cnt"]
         blocks_needed = _calculate_blocks_needed(actual_count)
         current_start += blocks_needed * 10
 
@@ -727,6 +785,78 @@ def reassign_out_of_range_channel(
     return new_number
 
 
+def reassign_out_of_range_channels_batch(
+    conn: Connection,
+    group_id: int,
+    channel_ids: list[int],
+) -> dict[int, int]:
+    """Reassign several out-of-range channels of one group in a single transaction.
+
+    Allocates the same way as reassign_out_of_range_channel, but the used
+    channel numbers are read once, new numbers are handed out in-process and
+    all updates are committed together instead of one commit per channel.
+
+    Args:
+        conn: Database connection
+        group_id: The event group ID
+        channel_ids: Managed channel IDs to reassign, in allocation order
+
+    Returns:
+        Dict mapping channel ID to its new channel number. Channels that could
+        not be given a number (range exhausted) are left out.
+    """
+    if not channel_ids:
+        return {}
+
+    # Same start, block end and pool as get_next_channel_number
+    allocation = _resolve_channel_allocation(conn, group_id)
+    if not allocation:
+        logger.warning(
+            "[CHANNEL_NUM] Could not reassign %d channels in group %d - no available numbers",
+            len(channel_ids),
+            group_id,
+        )
+        return {}
+
+    next_num, block_end, use_global_pool = allocation
+    limit = min(block_end, MAX_CHANNEL) if block_end else MAX_CHANNEL
+    if use_global_pool:
+        used_set = _get_all_auto_used_channels(conn)
+    else:
+        used_set = _get_group_used_channels(conn, group_id)
+
+    assignments: dict[int, int] = {}
+    for channel_id in channel_ids:
+        while next_num in used_set:
+            next_num += 1
+        if next_num > limit:
+            logger.warning(
+                "[CHANNEL_NUM] Could not reassign %d channels in group %d - range exhausted at %d",
+                len(channel_ids) - len(assignments),
+                group_id,
+                limit,
+            )
+            break
+        assignments[channel_id] = next_num
+        used_set.add(next_num)
+
+    if assignments:
+        conn.executemany(
+            "UPDATE managed_channels SET channel_number = ? WHERE id = ?",
+            [(number, channel_id) for channel_id, number in assignments.items()],
+        )
+        conn.commit()
+        logger.info(
+            "[CHANNEL_NUM] Reassigned %d channels in group %d (%d-%d)",
+            len(assignments),
+            group_id,
+            min(assignments.values()),
+            max(assignments.values()),
+        )
+
+    return assignments
+
+
 # =============================================================================
 # Global Sorting Functions
 # =============================================================================
@@ -27,12 +27,15 @@ from .history import (
     cleanup_old_history,
     get_channel_history,
     log_channel_history,
+    log_channel_history_batch,
 )
 
 # Keywords operations
 from .keywords import (
     check_exception_keyword,
+    compile_exception_keywords,
     get_exception_keywords,
+    match_exception_keyword,
 )
 
 # Settings helpers
@@ -45,8 +48,10 @@ from .settings_helpers import (
 # Stream operations
 from .streams import (
     add_stream_to_channel,
+    add_streams_to_channels,
     compute_stream_priority_from_rules,
     get_channel_streams,
+    get_group_stream_pairs,
     get_next_stream_priority,
     get_ordered_stream_ids,
     remove_stream_from_channel,
@@ -76,8 +81,10 @@ __all__ = [
     "find_any_channel_for_event",
     # Streams
     "add_stream_to_channel",
+    "add_streams_to_channels",
     "compute_stream_priority_from_rules",
     "get_channel_streams",
+    "get_group_stream_pairs",
     "get_next_stream_priority",
     "get_ordered_stream_ids",
     "remove_stream_from_channel",
@@ -86,11 +93,14 @@ __all__ = [
     "update_stream_priority",
     # History
     "log_channel_history",
+    "log_channel_history_batch",
     "get_channel_history",
     "cleanup_old_history",
     # Keywords
     "get_exception_keywords",
     "check_exception_keyword",
+    "compile_exception_keywords",
+    "match_exception_keyword",
     # Settings helpers
     "get_dispatcharr_settings",
     "get_reconciliation_settings",
@@ -8,6 +8,11 @@ from sqlite3 import Connection
 
 logger = logging.getLogger(__name__)
 
+# Shared by single and batch inserts so the prepared statement is cached once
+_INSERT_HISTORY_SQL = """INSERT INTO managed_channel_history
+    (managed_channel_id, change_type, change_source, field_name, old_value, new_value, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
 
 def log_channel_history(
     conn: Connection,
@@ -35,9 +40,7 @@ def log_channel_history(
         ID of history record
     """
     cursor = conn.execute(
-        """INSERT INTO managed_channel_history
-           (managed_channel_id, change_type, change_source, field_name, old_value, new_value, notes)
-           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        _INSERT_HISTORY_SQL,
         (managed_channel_id, change_type, change_source, field_name, old_value, new_value, notes),
     )
     logger.debug(
@@ -46,6 +49,39 @@ def log_channel_history(
     return cursor.lastrowid
 
 
+def log_channel_history_batch(conn: Connection, entries: list[dict]) -> int:
+    """Log many channel history entries with a single executemany.
+
+    Args:
+        conn: Database connection
+        entries: Dicts with managed_channel_id, change_type and optional
+            change_source, field_name, old_value, new_value, notes
+
+    Returns:
+        Number of history records created
+    """
+    if not entries:
+        return 0
+
+    conn.executemany(
+        _INSERT_HISTORY_SQL,
+        [
+            (
+                e["managed_channel_id"],
+                e["change_type"],
+                e.get("change_source"),
+                e.get("field_name"),
+                e.get("old_value"),
+                e.get("new_value"),
+                e.get("notes"),
+            )
+            for e in entries
+        ],
+    )
+    logger.debug("[HISTORY] %d entries (batch)", len(entries))
+    return len(entries)
+
+
 def get_channel_history(
     conn: Connection,
     managed_channel_id: int,
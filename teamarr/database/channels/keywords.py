@@ -85,3 +85,52 @@ def check_exception_keyword(
                 return (kw.label, kw.behavior)
 
     return (None, None)
+
+
+def compile_exception_keywords(
+    keywords: list[ExceptionKeyword],
+) -> list[tuple[re.Pattern[str], str, str]]:
+    """Precompile exception keywords for repeated matching.
+
+    Each keyword's terms are joined into one alternation pattern, so batch
+    callers pay for term splitting and regex compilation once instead of
+    once per stream. Keyword order is preserved (first keyword wins).
+
+    Args:
+        keywords: List of ExceptionKeyword objects
+
+    Returns:
+        List of (pattern, label, behavior) tuples for match_exception_keyword()
+    """
+    compiled = []
+    for kw in keywords:
+        terms = kw.match_term_list
+        if not terms:
+            continue
+        pattern = re.compile("|".join(_make_keyword_pattern(term) for term in terms))
+        compiled.append((pattern, kw.label, kw.behavior))
+    return compiled
+
+
+def match_exception_keyword(
+    stream_name: str,
+    compiled: list[tuple[re.Pattern[str], str, str]],
+) -> tuple[str | None, str | None]:
+    """Check stream name against precompiled exception keywords.
+
+    Same result as check_exception_keyword() for the same keyword list.
+
+    Args:
+        stream_name: Stream name to check
+        compiled: Output of compile_exception_keywords()
+
+    Returns:
+        Tuple of (label, behavior) or (None, None) if no match.
+    """
+    stream_lower = stream_name.lower()
+
+    for pattern, label, behavior in compiled:
+        if pattern.search(stream_lower):
+            return (label, behavior)
+
+    return (None, None)
@@ -10,6 +10,13 @@ from .types import ManagedChannelStream
 
 logger = logging.getLogger(__name__)
 
+# Fixed column list so every insert reuses the same cached prepared statement
+_INSERT_STREAM_SQL = """INSERT INTO managed_channel_streams
+    (managed_channel_id, dispatcharr_stream_id, priority, stream_name,
+     source_group_id, source_group_type, m3u_account_id, m3u_account_name,
+     exception_keyword)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
 
 def add_stream_to_channel(
     conn: Connection,
@@ -27,37 +34,25 @@ def add_stream_to_channel(
         dispatcharr_stream_id: Stream ID in Dispatcharr
         stream_name: Stream display name
         priority: Stream priority (0 = primary)
-        **kwargs: Additional fields
+        **kwargs: Additional fields (source_group_id, source_group_type,
+            m3u_account_id, m3u_account_name, exception_keyword)
 
     Returns:
         ID of created stream record
     """
-    columns = ["managed_channel_id", "dispatcharr_stream_id", "priority"]
-    values = [managed_channel_id, dispatcharr_stream_id, priority]
-
-    if stream_name:
-        columns.append("stream_name")
-        values.append(stream_name)
-
-    allowed_fields = [
-        "source_group_id",
-        "source_group_type",
-        "m3u_account_id",
-        "m3u_account_name",
-        "exception_keyword",
-    ]
-
-    for field_name in allowed_fields:
-        if field_name in kwargs and kwargs[field_name] is not None:
-            columns.append(field_name)
-            values.append(kwargs[field_name])
-
-    placeholders = ", ".join(["?"] * len(values))
-    column_str = ", ".join(columns)
-
     cursor = conn.execute(
-        f"INSERT INTO managed_channel_streams ({column_str}) VALUES ({placeholders})",
-        values,
+        _INSERT_STREAM_SQL,
+        (
+            managed_channel_id,
+            dispatcharr_stream_id,
+            priority,
+            stream_name or None,
+            kwargs.get("source_group_id"),
+            kwargs.get("source_group_type") or "parent",
+            kwargs.get("m3u_account_id"),
+            kwargs.get("m3u_account_name"),
+            kwargs.get("exception_keyword"),
+        ),
     )
     stream_id = cursor.lastrowid
     logger.debug(
@@ -69,6 +64,44 @@ def add_stream_to_channel(
     return stream_id
 
 
+def add_streams_to_channels(conn: Connection, streams: list[dict]) -> int:
+    """Add many streams to managed channels with a single executemany.
+
+    Batch alternative to add_stream_to_channel() for bulk callers.
+
+    Args:
+        conn: Database connection
+        streams: Dicts with managed_channel_id, dispatcharr_stream_id, priority and
+            optional stream_name, source_group_id, source_group_type,
+            m3u_account_id, m3u_account_name, exception_keyword
+
+    Returns:
+        Number of stream records created
+    """
+    if not streams:
+        return 0
+
+    conn.executemany(
+        _INSERT_STREAM_SQL,
+        [
+            (
+                s["managed_channel_id"],
+                s["dispatcharr_stream_id"],
+                s.get("priority", 0),
+                s.get("stream_name") or None,
+                s.get("source_group_id"),
+                s.get("source_group_type") or "parent",
+                s.get("m3u_account_id"),
+                s.get("m3u_account_name"),
+                s.get("exception_keyword"),
+            )
+            for s in streams
+        ],
+    )
+    logger.debug("[ATTACHED] %d streams (batch)", len(streams))
+    return len(streams)
+
+
 def remove_stream_from_channel(
     conn: Connection,
     managed_channel_id: int,
@@ -163,6 +196,33 @@ def stream_exists_on_channel(
     return cursor.fetchone() is not None
 
 
+def get_group_stream_pairs(
+    conn: Connection,
+    event_epg_group_id: int,
+) -> set[tuple[int, int]]:
+    """Get all active (channel, stream) attachments for a group's channels.
+
+    Batch alternative to calling stream_exists_on_channel() once per stream.
+
+    Args:
+        conn: Database connection
+        event_epg_group_id: Group that owns the channels
+
+    Returns:
+        Set of (managed_channel_id, dispatcharr_stream_id) tuples
+    """
+    cursor = conn.execute(
+        """SELECT mcs.managed_channel_id, mcs.dispatcharr_stream_id
+           FROM managed_channel_streams mcs
+           JOIN managed_channels mc ON mc.id = mcs.managed_channel_id
+           WHERE mc.event_epg_group_id = ?
+             AND mc.deleted_at IS NULL
+             AND mcs.removed_at IS NULL""",
+        (event_epg_group_id,),
+    )
+    return {(row[0], row[1]) for row in cursor}
+
+
 def compute_stream_priority_from_rules(
     conn: Connection,
     stream_name: str | None = None,
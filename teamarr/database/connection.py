@@ -10,6 +10,7 @@ from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
 
+from teamarr.core.sports import clear_sport_display_names_cache
 from teamarr.database.checkpoint_v43 import apply_checkpoint_v43
 
 logger = logging.getLogger(__name__)
@@ -42,7 +43,8 @@ def get_connection(db_path: Path | str | None = None) -> sqlite3.Connection:
 
     # timeout=30: Wait up to 30 seconds if database is locked by another connection
     # check_same_thread=False: Allow connection to be used across threads (required for FastAPI)
-    conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+    # cached_statements=256: Keep more prepared statements per connection (default 128)
+    conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False, cached_statements=256)
     conn.row_factory = sqlite3.Row
 
     # Enable Write-Ahead Logging for better concurrent access
@@ -138,6 +140,8 @@ def init_db(db_path: Path | str | None = None) -> None:
             _run_migrations(conn)
             # Seed TSDB cache if empty or incomplete
             _seed_tsdb_cache_if_needed(conn)
+            # Schema and migrations may have rewritten the sports table
+            clear_sport_display_names_cache()
 
             # Final verification: ensure settings table exists and is queryable
             conn.execute("SELECT id FROM settings LIMIT 1")
@@ -1205,6 +1209,24 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
         logger.info("[MIGRATE] Schema upgraded to version 51 (soccer followed teams)")
         current_version = 51
 
+    # v52: Partial index on active channel numbers per group
+    # Channel number allocation filters by group with deleted_at IS NULL and
+    # aggregates or gap-searches channel_number, so it can use the index alone
+    # (deleted_at is listed so older SQLite versions treat the index as covering)
+    if current_version < 52:
+        # Wrap in try-except for minimal test databases without the full managed_channels table
+        try:
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_mc_group_active_chan
+                ON managed_channels(event_epg_group_id, channel_number, deleted_at)
+                WHERE deleted_at IS NULL
+            """)
+        except sqlite3.OperationalError:
+            pass
+        conn.execute("UPDATE settings SET schema_version = 52 WHERE id = 1")
+        logger.info("[MIGRATE] Schema upgraded to version 52 (active channel number index)")
+        current_version = 52
+
 
 # =============================================================================
 # LEGACY MIGRATION HELPER FUNCTIONS
@@ -5,6 +5,7 @@ Provides CRUD operations for the event_epg_groups table.
 
 import json
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from sqlite3 import Connection
@@ -1349,6 +1350,21 @@ def get_all_group_xmltv(conn: Connection, group_ids: list[int] | None = None) ->
     Returns:
         List of XMLTV content strings (non-empty only)
     """
+    return list(iter_all_group_xmltv(conn, group_ids))
+
+
+def iter_all_group_xmltv(conn: Connection, group_ids: list[int] | None = None) -> Iterator[str]:
+    """Yield stored XMLTV content for multiple groups one row at a time.
+
+    The connection must stay open until the iterator is exhausted.
+
+    Args:
+        conn: Database connection
+        group_ids: Optional list of group IDs (None = all active groups)
+
+    Yields:
+        XMLTV content strings (non-empty only)
+    """
     if group_ids:
         placeholders = ",".join("?" * len(group_ids))
         cursor = conn.execute(
@@ -1366,7 +1382,8 @@ def get_all_group_xmltv(conn: Connection, group_ids: list[int] | None = None) ->
                AND x.xmltv_content IS NOT NULL AND x.xmltv_content != ''"""
         )
 
-    return [row["xmltv_content"] for row in cursor.fetchall()]
+    for row in cursor:
+        yield row["xmltv_content"]
 
 
 def store_group_xmltv(conn: Connection, group_id: int, xmltv_content: str) -> None:
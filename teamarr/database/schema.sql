@@ -546,6 +546,10 @@ CREATE INDEX IF NOT EXISTS idx_managed_channels_delete ON managed_channels(sched
 CREATE INDEX IF NOT EXISTS idx_managed_channels_dispatcharr ON managed_channels(dispatcharr_channel_id);
 CREATE INDEX IF NOT EXISTS idx_managed_channels_tvg ON managed_channels(tvg_id);
 CREATE INDEX IF NOT EXISTS idx_managed_channels_sync ON managed_channels(sync_status);
+-- Active channel numbers per group (channel number allocation queries)
+-- deleted_at is listed so older SQLite versions treat the partial index as covering
+CREATE INDEX IF NOT EXISTS idx_mc_group_active_chan ON managed_channels(event_epg_group_id, channel_number, deleted_at)
+    WHERE deleted_at IS NULL;
 
 -- Unique constraint for event channels
 -- Includes primary_stream_id to support 'separate' duplicate handling mode
@@ -32,6 +32,22 @@ from teamarr.utilities.constants import (
 logger = logging.getLogger(__name__)
 
 
+def _combine_patterns(patterns: list[Pattern[str]]) -> Pattern[str] | None:
+    """Compile patterns into one alternation that matches wherever any of them does.
+
+    All detection patterns share the IGNORECASE flag. Returns None when a
+    pattern has capture groups (backreferences would be renumbered) or the
+    combination doesn't compile (e.g. inline global flags), so callers fall
+    back to checking the patterns one by one.
+    """
+    if not patterns or any(pattern.groups for pattern in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns), re.IGNORECASE)
+    except re.error:
+        return None
+
+
 def _load_user_keywords(category: str) -> list[dict]:
     """Load user-defined keywords from database.
 
@@ -76,6 +92,9 @@ class DetectionKeywordService:
     _placeholder_patterns: ClassVar[list[Pattern[str]] | None] = None
     _card_segment_patterns: ClassVar[list[tuple[Pattern[str], str]] | None] = None
     _exclusion_patterns: ClassVar[list[Pattern[str]] | None] = None
+    # Single-pass alternations of the two lists above (None when not combinable)
+    _card_segment_any: ClassVar[Pattern[str] | None] = None
+    _exclusion_any: ClassVar[Pattern[str] | None] = None
     _separators: ClassVar[list[str] | None] = None
 
     # ==========================================================================
@@ -346,6 +365,9 @@ class DetectionKeywordService:
                         pattern_str,
                         e,
                     )
+            cls._card_segment_any = _combine_patterns(
+                [pattern for pattern, _ in cls._card_segment_patterns]
+            )
             logger.debug(
                 "[DETECT_SVC] Compiled %d card segment patterns (%d user)",
                 len(cls._card_segment_patterns),
@@ -396,6 +418,7 @@ class DetectionKeywordService:
                         pattern_str,
                         e,
                     )
+            cls._exclusion_any = _combine_patterns(cls._exclusion_patterns)
             logger.debug(
                 "[DETECT_SVC] Compiled %d exclusion patterns (%d user)",
                 len(cls._exclusion_patterns),
@@ -545,8 +568,20 @@ class DetectionKeywordService:
         Returns:
             Segment name ('early_prelims', 'prelims', 'main_card', 'combined') or None
         """
-        for pattern, segment in cls.get_card_segment_patterns():
-            if pattern.search(text):
+        patterns = cls.get_card_segment_patterns()
+
+        # One combined scan rules out most names. Priority still follows list
+        # order, each pattern searching from where the combined match starts
+        # (no pattern can match before it).
+        pos = 0
+        if cls._card_segment_any is not None:
+            first = cls._card_segment_any.search(text)
+            if not first:
+                return None
+            pos = first.start()
+
+        for pattern, segment in patterns:
+            if pattern.search(text, pos):
                 return segment
         return None
 
@@ -560,7 +595,10 @@ class DetectionKeywordService:
         Returns:
             True if stream matches exclusion patterns (weigh-ins, press conferences, etc.)
         """
-        for pattern in cls.get_exclusion_patterns():
+        patterns = cls.get_exclusion_patterns()
+        if cls._exclusion_any is not None:
+            return cls._exclusion_any.search(text) is not None
+        for pattern in patterns:
             if pattern.search(text):
                 return True
         return False
@@ -600,6 +638,8 @@ class DetectionKeywordService:
         cls._placeholder_patterns = None
         cls._card_segment_patterns = None
         cls._exclusion_patterns = None
+        cls._card_segment_any = None
+        cls._exclusion_any = None
         cls._separators = None
         logger.info("[DETECT_SVC] Pattern cache invalidated")
 
@@ -8,6 +8,8 @@ Display settings (time_format, show_timezone) are read from user configuration.
 
 import platform
 from datetime import UTC, datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
 from teamarr.config import (
     get_show_timezone,
@@ -64,6 +66,16 @@ def now_utc() -> datetime:
     return datetime.now(UTC)
 
 
+@lru_cache(maxsize=8192)
+def _astimezone(dt: datetime, tz: ZoneInfo) -> datetime:
+    """Cached timezone conversion.
+
+    The same event start times are converted many times per lifecycle sweep;
+    equal instants always convert to the same result, so caching is safe.
+    """
+    return dt.astimezone(tz)
+
+
 def to_user_tz(dt: datetime) -> datetime:
     """Convert any datetime to user timezone.
 
@@ -75,7 +87,7 @@ def to_user_tz(dt: datetime) -> datetime:
     """
     if dt.tzinfo is None:
         raise ValueError("Cannot convert naive datetime - must be timezone-aware")
-    return dt.astimezone(get_user_timezone())
+    return _astimezone(dt, get_user_timezone())
 
 
 def to_utc(dt: datetime) -> datetime:
@@ -4,6 +4,9 @@ Converts Programme dataclasses to XMLTV format.
 All times are output in the user's configured timezone.
 """
 
+import os
+from collections.abc import Iterable
+from pathlib import Path
 from xml.dom import minidom
 from xml.etree.ElementTree import Element, SubElement, tostring
 
@@ -136,7 +139,7 @@ def _prettify(xml_str: str) -> str:
 
 
 def merge_xmltv_content(
-    xmltv_contents: list[str],
+    xmltv_contents: Iterable[str],
     generator_name: str = "Teamarr",
     generator_url: str | None = None,
 ) -> str:
@@ -147,7 +150,7 @@ def merge_xmltv_content(
     convention: all channels first, then programmes sorted by channel.
 
     Args:
-        xmltv_contents: List of XMLTV XML strings
+        xmltv_contents: XMLTV XML strings (any iterable, consumed once)
         generator_name: Generator info for XML header
         generator_url: Generator URL for XML header
 
@@ -200,3 +203,33 @@ def merge_xmltv_content(
 
     xml_str = tostring(root, encoding="unicode")
     return _prettify(xml_str)
+
+
+# Characters per write: the encoder works on slices rather than one copy of the EPG
+_WRITE_CHUNK_CHARS = 1 << 20
+
+
+def write_xmltv_file(content: str, path: Path) -> int:
+    """Write XMLTV content to a file atomically.
+
+    Writes to a temporary sibling file and renames it over the target, so
+    readers (e.g. Dispatcharr fetching the EPG) never see a partial file.
+
+    Args:
+        content: XMLTV XML string
+        path: Output file path (parent directories are created)
+
+    Returns:
+        Size of the written file in bytes
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=_WRITE_CHUNK_CHARS) as f:
+            for i in range(0, len(content), _WRITE_CHUNK_CHARS):
+                f.write(content[i : i + _WRITE_CHUNK_CHARS])
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return path.stat().st_size
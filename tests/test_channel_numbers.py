@@ -0,0 +1,140 @@
+"""Tests for channel number allocation.
+
+These tests verify that batch reassignment of out-of-range channels hands
+out the same numbers as reassigning them one at a time.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from teamarr.database.channel_numbers import (
+    reassign_out_of_range_channel,
+    reassign_out_of_range_channels_batch,
+)
+from teamarr.database.connection import get_db, init_db
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+def _insert_group(conn, name, mode, sort_order, stream_count, start=None):
+    cursor = conn.execute(
+        """INSERT INTO event_epg_groups
+           (name, leagues, channel_assignment_mode, sort_order, total_stream_count,
+            channel_start_number)
+           VALUES (?, '[]', ?, ?, ?, ?)""",
+        (name, mode, sort_order, stream_count, start),
+    )
+    return cursor.lastrowid
+
+
+def _insert_channels(conn, group_id, numbers):
+    ids = []
+    for number in numbers:
+        key = f"{group_id}-{number}"
+        cursor = conn.execute(
+            """INSERT INTO managed_channels
+               (event_epg_group_id, event_id, event_provider, tvg_id, channel_name,
+                channel_number)
+               VALUES (?, ?, 'espn', ?, ?, ?)""",
+            (group_id, key, key, key, number),
+        )
+        ids.append(cursor.lastrowid)
+    return ids
+
+
+@pytest.fixture
+def db_dir():
+    """Create a temporary directory for database copies."""
+    path = Path(tempfile.mkdtemp())
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _build_db(db_dir, numbering_mode, assignment_mode):
+    """Create a database with two groups and return (path, group_id, out-of-range ids)."""
+    db_path = db_dir / "base.db"
+    init_db(db_path)
+
+    with get_db(db_path) as conn:
+        conn.execute(
+            """UPDATE settings SET channel_numbering_mode = ?,
+               channel_range_start = 101, channel_range_end = 400 WHERE id = 1""",
+            (numbering_mode,),
+        )
+        group_id = _insert_group(conn, "Target", assignment_mode, 0, 25, start=101)
+        other_id = _insert_group(conn, "Other", "auto", 1, 15)
+
+        # Gaps at 103, 106 and 108+ plus channels far outside any range
+        _insert_channels(conn, group_id, [101, 102, 104, 105, 107])
+        out_of_range = _insert_channels(conn, group_id, [90001, 90002, 90003, 90004])
+        _insert_channels(conn, other_id, [131, 132])
+        conn.commit()
+
+    return db_path, group_id, out_of_range
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+class TestBatchReassignment:
+    """Tests for reassign_out_of_range_channels_batch."""
+
+    @pytest.mark.parametrize(
+        "numbering_mode,assignment_mode",
+        [
+            ("strict_block", "auto"),
+            ("rational_block", "auto"),
+            ("strict_compact", "auto"),
+            ("strict_block", "manual"),
+        ],
+    )
+    def test_batch_matches_single_reassignment(self, db_dir, numbering_mode, assignment_mode):
+        """Batch assigns the same numbers as repeated single reassignment."""
+        base_path, group_id, channel_ids = _build_db(db_dir, numbering_mode, assignment_mode)
+        single_path = db_dir / "single.db"
+        batch_path = db_dir / "batch.db"
+        shutil.copy(base_path, single_path)
+        shutil.copy(base_path, batch_path)
+
+        with get_db(single_path) as conn:
+            single = {}
+            for channel_id in channel_ids:
+                new_number = reassign_out_of_range_channel(conn, group_id, channel_id, 0)
+                if not new_number:
+                    break
+                single[channel_id] = new_number
+
+        with get_db(batch_path) as conn:
+            batch = reassign_out_of_range_channels_batch(conn, group_id, channel_ids)
+            stored = {
+                row["id"]: row["channel_number"]
+                for row in conn.execute(
+                    "SELECT id, channel_number FROM managed_channels WHERE id IN (?, ?, ?, ?)",
+                    channel_ids,
+                )
+            }
+
+        assert single
+        assert batch == single
+        assert {cid: int(stored[cid]) for cid in batch} == batch
+
+    def test_batch_stops_at_block_end(self, db_dir):
+        """Channels beyond the group's block are left unassigned."""
+        base_path, group_id, channel_ids = _build_db(db_dir, "strict_block", "auto")
+
+        with get_db(base_path) as conn:
+            # Next group's channels now start right after the free 103 and 106
+            conn.execute(
+                "UPDATE managed_channels SET channel_number = 108 WHERE channel_number = '131'"
+            )
+            conn.commit()
+            batch = reassign_out_of_range_channels_batch(conn, group_id, channel_ids)
+
+        assert list(batch.values()) == [103, 106]
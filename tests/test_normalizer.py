@@ -0,0 +1,35 @@
+"""Tests for stream name date/time/timezone extraction.
+
+These tests pin the standalone timezone check to whole trailing words, so
+word endings like "...NET" or "...uz" are not read as timezone abbreviations.
+"""
+
+import pytest
+
+from teamarr.consumers.matching.normalizer import extract_and_mask_datetime
+
+
+class TestStandaloneTimezone:
+    """Tests for a trailing timezone abbreviation with no time before it."""
+
+    @pytest.mark.parametrize(
+        "stream_name",
+        [
+            "NBA | Celtics SPORTSNET",
+            "NBA | Lakers vs Santa Cruz",
+            "NHL: tnt",
+        ],
+    )
+    def test_word_ending_is_not_a_timezone(self, stream_name):
+        """A word that merely ends like an abbreviation keeps its full name."""
+        masked, _, _, tz = extract_and_mask_datetime(stream_name)
+
+        assert masked == stream_name
+        assert tz is None
+
+    def test_trailing_abbreviation_is_extracted(self):
+        """A standalone trailing abbreviation is removed and mapped to its zone."""
+        masked, _, _, tz = extract_and_mask_datetime("Lakers @ Celtics @ ET")
+
+        assert masked == "Lakers @ Celtics"
+        assert tz == "America/New_York"